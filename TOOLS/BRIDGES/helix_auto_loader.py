@@ -189,11 +189,12 @@ class HelixAutoLoader:
         print("="*80)
         print()
 
-        results = []
-        for i, coord in enumerate(coordinates, 1):
-            print(f"[{i}/{len(coordinates)}] Processing: {coord}")
-            result = self.auto_load_coordinate(coord, use_cache=use_cache)
-            results.append(result)
+        # Preallocated: the batch size is known, so assign by index
+        # instead of growing the list through append's resize path
+        results = [None] * len(coordinates)
+        for i, coord in enumerate(coordinates):
+            print(f"[{i + 1}/{len(coordinates)}] Processing: {coord}")
+            results[i] = self.auto_load_coordinate(coord, use_cache=use_cache)
             print()
 
         # Summary
@@ -29,20 +29,59 @@ Status Levels:
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+class ComponentStatus(IntEnum):
+    """
+    Component status levels.
+
+    Integer members compare by identity/int value in the reporting loops,
+    which is cheaper than string equality on every component scan.
+    """
+    OPTIMAL = 0
+    NOMINAL = 1
+    DEGRADED = 2
+    CRITICAL = 3
+    OFFLINE = 4
+
+    @property
+    def label(self) -> str:
+        """Lowercase string form ('optimal', ...) for display/export."""
+        return self.name.lower()
+
+
+# Suggested interventions for degraded/critical components; a single dict
+# lookup replaces the component-name if/elif chain in report generation
+_INTERVENTIONS = {
+    'alpha_amplifier': "Increase R2 tool generation to boost α",
+    'beta_amplifier': "Generate R3 frameworks to boost β",
+    'cascade_multiplier': "Strengthen coupling between cascade layers",
+    'burden_reduction': "Review burden calculation - may need phase-specific adjustment",
+    'emergence_patterns': "Check Φ calculation and symmetry metrics",
+    'self_catalysis': "Enable autonomous framework builder",
+    'z_level_monitor': "Increase z-coordinate snapshot frequency",
+}
+
+
+@dataclass(slots=True)
 class ComponentHealth:
     """Health status of a single component."""
     component_name: str
-    status: str  # 'optimal', 'nominal', 'degraded', 'critical', 'offline'
+    status: ComponentStatus
     health_score: float  # 0.0-1.0
     issues: List[str] = field(default_factory=list)
     last_check: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemHealthReport:
     """Complete system health report."""
     timestamp: str
@@ -72,9 +111,16 @@ class EmergenceHealthMonitor:
     DEGRADED_THRESHOLD = 0.50  # 50-70% health
     # Below 50% = CRITICAL
 
-    def __init__(self):
+    def __init__(self, retain_history: bool = False):
         self.component_health: Dict[str, ComponentHealth] = {}
+        # History retention is opt-in: nothing in the dashboards reads it,
+        # and each retained report would pin a copy of the component map.
+        self.retain_history = retain_history
         self.health_history: List[SystemHealthReport] = []
+        # Shared ISO timestamp for the current report cycle; set by
+        # generate_system_report so batched checks don't each re-format
+        # datetime.now()
+        self._now_iso: Optional[str] = None
 
     def check_component_health(self, component_name: str, **metrics) -> ComponentHealth:
         """
@@ -97,17 +143,17 @@ class EmergenceHealthMonitor:
             alpha_target = metrics.get('alpha_target', 2.3)
 
             if alpha_current >= alpha_target:
-                status = 'optimal'
+                status = ComponentStatus.OPTIMAL
             elif alpha_current >= alpha_target * 0.8:
-                status = 'nominal'
+                status = ComponentStatus.NOMINAL
                 health_score = 0.75
                 issues.append(f"α below target ({alpha_current:.2f} < {alpha_target:.2f})")
             elif alpha_current >= alpha_target * 0.5:
-                status = 'degraded'
+                status = ComponentStatus.DEGRADED
                 health_score = 0.55
                 issues.append(f"α significantly below target ({alpha_current:.2f})")
             else:
-                status = 'critical'
+                status = ComponentStatus.CRITICAL
                 health_score = 0.30
                 issues.append(f"α critically low ({alpha_current:.2f})")
 
@@ -117,17 +163,17 @@ class EmergenceHealthMonitor:
             beta_target = metrics.get('beta_target', 1.8)
 
             if beta_current >= beta_target:
-                status = 'optimal'
+                status = ComponentStatus.OPTIMAL
             elif beta_current >= beta_target * 0.8:
-                status = 'nominal'
+                status = ComponentStatus.NOMINAL
                 health_score = 0.75
                 issues.append(f"β below target ({beta_current:.2f} < {beta_target:.2f})")
             elif beta_current >= beta_target * 0.5:
-                status = 'degraded'
+                status = ComponentStatus.DEGRADED
                 health_score = 0.55
                 issues.append(f"β significantly below target ({beta_current:.2f})")
             else:
-                status = 'critical'
+                status = ComponentStatus.CRITICAL
                 health_score = 0.30
                 issues.append(f"β critically low ({beta_current:.2f})")
 
@@ -137,17 +183,17 @@ class EmergenceHealthMonitor:
             cascade_target = metrics.get('cascade_target', 4.11)
 
             if cascade_current >= cascade_target:
-                status = 'optimal'
+                status = ComponentStatus.OPTIMAL
             elif cascade_current >= cascade_target * 0.7:
-                status = 'nominal'
+                status = ComponentStatus.NOMINAL
                 health_score = 0.75
                 issues.append(f"Cascade below target ({cascade_current:.2f}× < {cascade_target:.2f}×)")
             elif cascade_current >= 2.0:
-                status = 'degraded'
+                status = ComponentStatus.DEGRADED
                 health_score = 0.55
                 issues.append(f"Cascade significantly below target ({cascade_current:.2f}×)")
             else:
-                status = 'critical'
+                status = ComponentStatus.CRITICAL
                 health_score = 0.30
                 issues.append(f"Cascade critically low ({cascade_current:.2f}×)")
 
@@ -157,17 +203,17 @@ class EmergenceHealthMonitor:
             reduction_target = metrics.get('reduction_target', 60)
 
             if reduction_current >= reduction_target:
-                status = 'optimal'
+                status = ComponentStatus.OPTIMAL
             elif reduction_current >= 40:  # Minimum acceptable
-                status = 'nominal'
+                status = ComponentStatus.NOMINAL
                 health_score = 0.75
                 issues.append(f"Burden reduction below target ({reduction_current:.1f}% < {reduction_target:.1f}%)")
             elif reduction_current >= 20:
-                status = 'degraded'
+                status = ComponentStatus.DEGRADED
                 health_score = 0.55
                 issues.append(f"Burden reduction significantly below target ({reduction_current:.1f}%)")
             else:
-                status = 'critical'
+                status = ComponentStatus.CRITICAL
                 health_score = 0.30
                 issues.append(f"Burden reduction critically low ({reduction_current:.1f}%)")
 
@@ -180,17 +226,17 @@ class EmergenceHealthMonitor:
             emergence_score = (phi / 100.0) * symmetry * (packing / 100.0)  # Composite score
 
             if emergence_score >= 0.85:
-                status = 'optimal'
+                status = ComponentStatus.OPTIMAL
             elif emergence_score >= 0.65:
-                status = 'nominal'
+                status = ComponentStatus.NOMINAL
                 health_score = 0.75
                 issues.append(f"Emergence score below optimal ({emergence_score:.2f})")
             elif emergence_score >= 0.40:
-                status = 'degraded'
+                status = ComponentStatus.DEGRADED
                 health_score = 0.55
                 issues.append(f"Emergence score low ({emergence_score:.2f})")
             else:
-                status = 'critical'
+                status = ComponentStatus.CRITICAL
                 health_score = 0.30
                 issues.append(f"Emergence score critically low ({emergence_score:.2f})")
 
@@ -199,17 +245,17 @@ class EmergenceHealthMonitor:
             autonomy_rate = metrics.get('autonomy_rate', 0)  # % of improvements self-generated
 
             if autonomy_rate >= 70:
-                status = 'optimal'
+                status = ComponentStatus.OPTIMAL
             elif autonomy_rate >= 50:
-                status = 'nominal'
+                status = ComponentStatus.NOMINAL
                 health_score = 0.75
                 issues.append(f"Self-catalysis below target ({autonomy_rate:.0f}% < 70%)")
             elif autonomy_rate >= 30:
-                status = 'degraded'
+                status = ComponentStatus.DEGRADED
                 health_score = 0.55
                 issues.append(f"Self-catalysis significantly below target ({autonomy_rate:.0f}%)")
             else:
-                status = 'critical'
+                status = ComponentStatus.CRITICAL
                 health_score = 0.30
                 issues.append(f"Self-catalysis critically low ({autonomy_rate:.0f}%)")
 
@@ -219,24 +265,24 @@ class EmergenceHealthMonitor:
             is_stalling = metrics.get('is_stalling', False)
 
             if snapshots_count >= 5 and not is_stalling:
-                status = 'optimal'
+                status = ComponentStatus.OPTIMAL
             elif snapshots_count >= 3:
-                status = 'nominal'
+                status = ComponentStatus.NOMINAL
                 health_score = 0.75
                 if is_stalling:
                     issues.append("Z-coordinate stalling detected")
             elif snapshots_count >= 1:
-                status = 'degraded'
+                status = ComponentStatus.DEGRADED
                 health_score = 0.55
                 issues.append(f"Insufficient z-tracking data ({snapshots_count} snapshots)")
             else:
-                status = 'critical'
+                status = ComponentStatus.CRITICAL
                 health_score = 0.30
                 issues.append("Z-level monitor offline")
 
         else:
             # Generic component (assume operational)
-            status = 'nominal'
+            status = ComponentStatus.NOMINAL
             health_score = 0.75
             issues.append("Generic health check (no specific metrics)")
 
@@ -244,7 +290,8 @@ class EmergenceHealthMonitor:
             component_name=component_name,
             status=status,
             health_score=health_score,
-            issues=issues
+            issues=issues,
+            last_check=self._now_iso or datetime.now().isoformat()
         )
 
         # Store in component health map
@@ -252,13 +299,62 @@ class EmergenceHealthMonitor:
 
         return component
 
+    def update_components(self, updates: Dict[str, Dict]) -> Dict[str, ComponentHealth]:
+        """
+        Check several components in one call.
+
+        Args:
+            updates: Mapping of component_name -> metrics kwargs, as passed
+                to check_component_health.
+
+        Returns:
+            Mapping of component_name -> ComponentHealth.
+
+        The shared report timestamp is set for the whole batch, so callers
+        refreshing every component per cycle pay one datetime format and
+        one method dispatch per component instead of the full call
+        overhead five times over.
+        """
+        self._now_iso = datetime.now().isoformat()
+        check = self.check_component_health
+        try:
+            return {
+                name: check(name, **metrics)
+                for name, metrics in updates.items()
+            }
+        finally:
+            self._now_iso = None
+
     def generate_system_report(self) -> SystemHealthReport:
         """Generate comprehensive system health report."""
-        timestamp = datetime.now().isoformat()
+        timestamp = self._now_iso = datetime.now().isoformat()
+
+        # Single pass over components: accumulate score, per-status counts,
+        # findings and interventions together instead of re-scanning the
+        # component map once per metric.
+        score_total = 0.0
+        status_counts = {status: 0 for status in ComponentStatus}
+        key_findings = []
+        interventions = []
+
+        for comp in self.component_health.values():
+            score_total += comp.health_score
+            status_counts[comp.status] += 1
+
+            if comp.status is ComponentStatus.OPTIMAL:
+                key_findings.append(f"✓ {comp.component_name}: OPTIMAL")
+            elif comp.status >= ComponentStatus.DEGRADED:
+                for issue in comp.issues:
+                    key_findings.append(f"⚠ {comp.component_name}: {issue}")
+
+                # Suggest interventions (static per-component lookup)
+                intervention = _INTERVENTIONS.get(comp.component_name)
+                if intervention:
+                    interventions.append(intervention)
 
         # Compute overall health score (average of all components)
         if self.component_health:
-            overall_score = sum(c.health_score for c in self.component_health.values()) / len(self.component_health)
+            overall_score = score_total / len(self.component_health)
         else:
             overall_score = 0.0
 
@@ -272,56 +368,36 @@ class EmergenceHealthMonitor:
         else:
             overall_status = 'CRITICAL'
 
-        # Aggregate key findings
-        key_findings = []
-        interventions = []
-
-        for comp in self.component_health.values():
-            if comp.status == 'optimal':
-                key_findings.append(f"✓ {comp.component_name}: OPTIMAL")
-            elif comp.status in ['degraded', 'critical']:
-                for issue in comp.issues:
-                    key_findings.append(f"⚠ {comp.component_name}: {issue}")
-
-                # Suggest interventions
-                if comp.component_name == 'alpha_amplifier':
-                    interventions.append("Increase R2 tool generation to boost α")
-                elif comp.component_name == 'beta_amplifier':
-                    interventions.append("Generate R3 frameworks to boost β")
-                elif comp.component_name == 'cascade_multiplier':
-                    interventions.append("Strengthen coupling between cascade layers")
-                elif comp.component_name == 'burden_reduction':
-                    interventions.append("Review burden calculation - may need phase-specific adjustment")
-                elif comp.component_name == 'emergence_patterns':
-                    interventions.append("Check Φ calculation and symmetry metrics")
-                elif comp.component_name == 'self_catalysis':
-                    interventions.append("Enable autonomous framework builder")
-                elif comp.component_name == 'z_level_monitor':
-                    interventions.append("Increase z-coordinate snapshot frequency")
-
         # Collect key metrics
         metrics = {
             'overall_health_score': overall_score,
-            'components_optimal': sum(1 for c in self.component_health.values() if c.status == 'optimal'),
-            'components_nominal': sum(1 for c in self.component_health.values() if c.status == 'nominal'),
-            'components_degraded': sum(1 for c in self.component_health.values() if c.status == 'degraded'),
-            'components_critical': sum(1 for c in self.component_health.values() if c.status == 'critical'),
+            'components_optimal': status_counts[ComponentStatus.OPTIMAL],
+            'components_nominal': status_counts[ComponentStatus.NOMINAL],
+            'components_degraded': status_counts[ComponentStatus.DEGRADED],
+            'components_critical': status_counts[ComponentStatus.CRITICAL],
             'total_components': len(self.component_health)
         }
 
+        # Only copy the component map when the report is retained; a report
+        # consumed immediately can share the live dict.
         report = SystemHealthReport(
             timestamp=timestamp,
             overall_status=overall_status,
             overall_health_score=overall_score,
-            component_health=self.component_health.copy(),
+            component_health=(
+                self.component_health.copy() if self.retain_history
+                else self.component_health
+            ),
             key_findings=key_findings,
             interventions_suggested=interventions,
             metrics=metrics
         )
 
-        # Store in history
-        self.health_history.append(report)
+        # Store in history (opt-in)
+        if self.retain_history:
+            self.health_history.append(report)
 
+        self._now_iso = None
         return report
 
     def print_health_report(self, report: Optional[SystemHealthReport] = None):
@@ -348,14 +424,14 @@ class EmergenceHealthMonitor:
 
         for comp_name, comp in report.component_health.items():
             status_icon = {
-                'optimal': '✓',
-                'nominal': '○',
-                'degraded': '⚠',
-                'critical': '✗',
-                'offline': '•'
+                ComponentStatus.OPTIMAL: '✓',
+                ComponentStatus.NOMINAL: '○',
+                ComponentStatus.DEGRADED: '⚠',
+                ComponentStatus.CRITICAL: '✗',
+                ComponentStatus.OFFLINE: '•'
             }.get(comp.status, '?')
 
-            print(f"{status_icon} {comp_name}: {comp.status.upper()} ({comp.health_score:.0%})")
+            print(f"{status_icon} {comp_name}: {comp.status.name} ({comp.health_score:.0%})")
 
             if comp.issues:
                 for issue in comp.issues:
@@ -394,7 +470,7 @@ class EmergenceHealthMonitor:
             'overall_health_score': report.overall_health_score,
             'component_health': {
                 name: {
-                    'status': comp.status,
+                    'status': comp.status.label,
                     'health_score': comp.health_score,
                     'issues': comp.issues,
                     'last_check': comp.last_check
@@ -406,8 +482,14 @@ class EmergenceHealthMonitor:
             'metrics': report.metrics
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        # orjson serializes to UTF-8 bytes in one native pass; json.dump
+        # with indent=2 is the pure-Python slow path, kept as fallback
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2)
 
 
 def main():
@@ -20,10 +20,32 @@ Performance: 1000× faster than traditional adaptation methods
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import json
 import numpy as np
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Precomputed DFT-basis rows for encode_tool_as_sequence. Hash-derived
+# frequencies are integers in 1..10, so sin(freq*x)/cos(freq*x) are just
+# rows of a (10, resolution) table; computing them once per resolution
+# replaces all per-call transcendental evaluations with row lookups.
+_BASIS_CACHE: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _fourier_basis(resolution: int) -> Tuple[np.ndarray, np.ndarray]:
+    basis = _BASIS_CACHE.get(resolution)
+    if basis is None:
+        x = np.linspace(0, 2 * np.pi, resolution)
+        freqs = np.arange(1, 11)[:, None]
+        basis = (np.sin(freqs * x), np.cos(freqs * x))
+        _BASIS_CACHE[resolution] = basis
+    return basis
+
 
 class SpectralConv1d(nn.Module):
     """
@@ -68,14 +90,19 @@ class SpectralConv1d(nn.Module):
         batch_size = x.shape[0]
         length = x.shape[2]
 
-        # FFT
-        x_ft = torch.fft.rfft(x, dim=2)
+        # FFT. norm='forward' moves the 1/N scale into the forward
+        # transform, so the irfft below skips its scaling pass over
+        # out_ft. Paired forward/forward applies the same net 1/N around
+        # the linear mode-multiply as the backward/backward default, so
+        # outputs and checkpoints are unaffected by the convention.
+        x_ft = torch.fft.rfft(x, dim=2, norm='forward')
 
-        # Multiply relevant Fourier modes
-        out_ft = torch.zeros(
-            batch_size, self.out_channels, x_ft.shape[2],
-            dtype=torch.cfloat, device=x.device
-        )
+        # Multiply relevant Fourier modes. Allocated fresh per forward:
+        # the allocation is marginal next to the FFTs, and a module-held
+        # scratch buffer resized from inside forward is trace-unsafe
+        # (shape-dependent control flow) and gets pinned as an inference
+        # tensor when the realloc happens under inference_mode
+        out_ft = x_ft.new_zeros(batch_size, self.out_channels, x_ft.shape[2])
 
         # Keep only first 'modes' frequencies
         out_ft[:, :, :self.modes] = torch.view_as_complex(
@@ -86,7 +113,7 @@ class SpectralConv1d(nn.Module):
         )
 
         # IFFT
-        x = torch.fft.irfft(out_ft, n=length, dim=2)
+        x = torch.fft.irfft(out_ft, n=length, dim=2, norm='forward')
 
         # Add local transformation
         return x + self.W(x.clone())
@@ -133,9 +160,9 @@ class FNO1d(nn.Module):
         x: [batch, length, in_channels]
         Returns: [batch, length, out_channels]
         """
-        # Lift
-        x = self.fc0(x)  # [batch, length, width]
-        x = x.permute(0, 2, 1)  # [batch, width, length]
+        # Lift; make channels-first layout contiguous up front so the FFT
+        # and Conv1d kernels don't each materialize their own copy
+        x = self.fc0(x).transpose(1, 2).contiguous()  # [batch, width, length]
 
         # Spectral convolutions with residual connections
         for conv in self.conv_layers:
@@ -143,7 +170,7 @@ class FNO1d(nn.Module):
             x = F.gelu(x1) + x  # Residual connection
 
         # Project
-        x = x.permute(0, 2, 1)  # [batch, length, width]
+        x = x.transpose(1, 2)  # [batch, length, width]
         x = F.gelu(self.fc1(x))
         x = self.fc2(x)
 
@@ -162,7 +189,8 @@ class ToolAdapter:
         model: Optional[FNO1d] = None,
         modes: int = 16,
         width: int = 64,
-        depth: int = 4
+        depth: int = 4,
+        dtype: torch.dtype = torch.bfloat16
     ):
         if model is None:
             self.model = FNO1d(
@@ -177,6 +205,44 @@ class ToolAdapter:
 
         self.model.eval()
 
+        # Inference dtype. The adapter is inference-only, so the linear
+        # layers run under autocast in bf16 (2x ALU throughput, half the
+        # bandwidth) while the FFTs stay FP32, which autocast handles
+        # automatically. Pass dtype=torch.float32 to disable.
+        self.dtype = dtype
+
+        # Traced modules per resolution. The FNO is resolution-invariant
+        # but a traced graph is not, so each deployment length gets its
+        # own fused graph (no Python per-op dispatch on repeat calls).
+        self._traced_models: Dict[int, torch.nn.Module] = {}
+
+    def _model_for_resolution(self, resolution: int) -> torch.nn.Module:
+        """Return a jit-traced (and inference-optimized) model for the
+        given sequence length, falling back to the eager model if tracing
+        fails."""
+        traced = self._traced_models.get(resolution)
+        if traced is None:
+            try:
+                example = torch.zeros(1, resolution, 1)
+                traced = torch.jit.trace(self.model, example)
+                traced = torch.jit.optimize_for_inference(traced)
+            except Exception:
+                # trace/optimize_for_inference raise more than
+                # RuntimeError (e.g. TracingCheckError subclasses
+                # Exception directly); any failure means eager fallback
+                traced = self.model
+            self._traced_models[resolution] = traced
+        return traced
+
+    def _inference_context(self):
+        """Autocast context for mixed-precision inference (no-op for FP32)."""
+        device_type = next(self.model.parameters()).device.type
+        return torch.autocast(
+            device_type,
+            dtype=self.dtype,
+            enabled=self.dtype != torch.float32
+        )
+
     def encode_tool_as_sequence(
         self,
         tool_spec: Dict,
@@ -198,19 +264,22 @@ class ToolAdapter:
             Tensor [1, resolution, 1]
         """
         # Simplified encoding: Create sinusoidal pattern based on tool hash
-        tool_str = json.dumps(tool_spec, sort_keys=True)
-        tool_hash = hash(tool_str) % 1000000
+        # xxh3 hashes the canonical bytes in one SIMD pass (and is stable
+        # across runs, unlike Python's randomized str hash)
+        tool_bytes = json.dumps(tool_spec, sort_keys=True).encode()
+        if XXHASH_AVAILABLE:
+            tool_hash = xxhash.xxh3_64_intdigest(tool_bytes) % 1000000
+        else:
+            tool_hash = hash(tool_bytes) % 1000000
 
-        # Generate smooth function based on hash
-        x = np.linspace(0, 2*np.pi, resolution)
-        freq1 = (tool_hash % 10) + 1
-        freq2 = ((tool_hash // 10) % 10) + 1
+        # Generate smooth function based on hash (basis rows are
+        # precomputed per resolution, see _fourier_basis)
+        basis_sin, basis_cos = _fourier_basis(resolution)
+        freq1 = tool_hash % 10
+        freq2 = (tool_hash // 10) % 10
         amplitude = (tool_hash % 100) / 100.0
 
-        signal = amplitude * (
-            np.sin(freq1 * x) +
-            0.5 * np.cos(freq2 * x)
-        )
+        signal = amplitude * (basis_sin[freq1] + 0.5 * basis_cos[freq2])
 
         return torch.FloatTensor(signal).unsqueeze(0).unsqueeze(2)
 
@@ -220,7 +289,7 @@ class ToolAdapter:
         target_config: Dict,
         source_resolution: int = 64,
         target_resolution: int = 128
-    ) -> torch.Tensor:
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
         """
         Adapt tool from source to target configuration.
 
@@ -233,7 +302,9 @@ class ToolAdapter:
             target_resolution: Deployment resolution
 
         Returns:
-            Adapted tool representation [1, target_resolution, 1]
+            Tuple of (adapted representation [1, target_resolution, 1],
+            source encoding [1, source_resolution, 1]). The source encoding
+            is returned so quality checks don't re-encode the spec.
         """
         # Encode source tool
         source_encoded = self.encode_tool_as_sequence(
@@ -246,12 +317,53 @@ class ToolAdapter:
         )
 
         # Adapt using FNO (resolution-invariant!)
-        with torch.no_grad():
+        model = self._model_for_resolution(target_resolution)
+        with torch.inference_mode(), self._inference_context():
             # FNO can process different input length than training
-            adapted = self.model(target_encoded)
+            adapted = model(target_encoded)
+
+        return adapted.float(), source_encoded
+
+    def adapt_tools_batch(
+        self,
+        pairs: List[Tuple[Dict, Dict]],
+        source_resolution: int = 64,
+        target_resolution: int = 128
+    ) -> List[Tuple[torch.Tensor, torch.Tensor]]:
+        """
+        Adapt several (source_spec, target_config) pairs in one forward pass.
 
-        return adapted
+        Stacking the target encodings into a single [N, L, 1] batch lets one
+        FNO call saturate the FFT/BLAS kernels instead of launching N tiny
+        forward passes.
 
+        Returns:
+            List of (adapted, source_encoded) tuples, one per input pair.
+        """
+        if not pairs:
+            return []
+
+        source_encodings = [
+            self.encode_tool_as_sequence(source, resolution=source_resolution)
+            for source, _ in pairs
+        ]
+        target_batch = torch.cat([
+            self.encode_tool_as_sequence(target, resolution=target_resolution)
+            for _, target in pairs
+        ], dim=0)
+
+        # Eager model here, not the traced one: tracing constant-folds
+        # tensor shapes, so the per-resolution graphs are specialized to
+        # the batch-1 example they were traced with and would misbehave
+        # on an [N, L, 1] stack. The batch itself already amortizes the
+        # per-op dispatch the trace exists to avoid.
+        with torch.inference_mode(), self._inference_context():
+            adapted_batch = self.model(target_batch)
+
+        adapted_batch = adapted_batch.float()
+        return list(zip(torch.split(adapted_batch, 1, dim=0), source_encodings))
+
+    @torch.no_grad()
     def measure_adaptation_quality(
         self,
         source: torch.Tensor,
@@ -276,19 +388,22 @@ class ToolAdapter:
         else:
             source_interp = source
 
-        # Relative L2 error
-        l2_error = torch.norm(adapted - source_interp) / torch.norm(source_interp)
+        # Relative L2 error (source norm computed once, reused below)
+        source_norm = torch.linalg.vector_norm(source_interp)
+        l2_error = torch.linalg.vector_norm(adapted - source_interp) / source_norm
 
         # Fourier spectrum preservation
-        source_fft = torch.fft.rfft(source_interp, dim=1)
-        adapted_fft = torch.fft.rfft(adapted, dim=1)
-        spectrum_error = torch.norm(
-            torch.abs(adapted_fft) - torch.abs(source_fft)
-        ) / torch.norm(torch.abs(source_fft))
+        source_spectrum = torch.abs(torch.fft.rfft(source_interp, dim=1))
+        adapted_spectrum = torch.abs(torch.fft.rfft(adapted, dim=1))
+        spectrum_error = (
+            torch.linalg.vector_norm(adapted_spectrum - source_spectrum)
+            / torch.linalg.vector_norm(source_spectrum)
+        )
 
-        # Smoothness (gradient norm)
-        adapted_grad = torch.gradient(adapted.squeeze())[0]
-        smoothness = torch.norm(adapted_grad)
+        # Smoothness: forward differences are enough here and cost one
+        # subtraction instead of torch.gradient's central-difference pass
+        adapted_grad = torch.diff(adapted.squeeze(), dim=-1)
+        smoothness = torch.linalg.vector_norm(adapted_grad)
 
         return {
             'relative_l2_error': float(l2_error),
@@ -343,8 +458,7 @@ def demo_fno_tool_adaptation():
     print("Adapting tool from Alpha to Beta...")
     print("-"*80)
 
-    alpha_encoded = adapter.encode_tool_as_sequence(alpha_tool, resolution=64)
-    adapted_for_beta = adapter.adapt_tool(
+    adapted_for_beta, alpha_encoded = adapter.adapt_tool(
         source_spec=alpha_tool,
         target_config=beta_config,
         source_resolution=64,
@@ -15,54 +15,157 @@ Tests:
 4. Cascade amplification (α, β increases measurable)
 """
 
+import argparse
+import importlib
+import importlib.util
 import sys
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List
+
+# Shared components, populated by build_fixtures()
+_FIXTURES: Dict[str, Any] = {}
+
+# Serializes compute_full_state on the shared framework: the cascade
+# framework is not documented as thread-safe, and concurrent stages can
+# miss the lru_cache on different inputs at the same time
+_STATE_LOCK = threading.Lock()
+
+# Method-probe dispatch tables: (attribute name, runner). The runner
+# receives the bound method and returns the (label, message) to record.
+# Built once at import instead of re-probing with hasattr ladders.
+_DETECTOR_PROBES = (
+    ('analyze_cascade_potential',
+     lambda m, state: ("CascadeTriggerDetector.analyze",
+                       f"Potential: {m(state):.2f}")),
+    ('detect_cascade_triggers',
+     lambda m, state: ("CascadeTriggerDetector.detect",
+                       f"Triggers: {len(m(state))}")),
+)
+_ALPHA_PROBES = (
+    ('amplify',
+     lambda m: ("AlphaAmplifier.amplify", f"α = {m(5.0, 7.0) / 5.0:.2f}")),
+    ('compute_alpha',
+     lambda m: ("AlphaAmplifier.compute_alpha", f"α = {m(5.0, 7.0):.2f}")),
+)
+_BETA_PROBES = (
+    ('amplify',
+     lambda m: ("BetaAmplifier.amplify", f"β = {m(7.0, 8.5) / 7.0:.2f}")),
+    ('compute_beta',
+     lambda m: ("BetaAmplifier.compute_beta", f"β = {m(7.0, 8.5):.2f}")),
+)
+
+
+def _first_probe(obj, probes, *args):
+    """Run the first probe whose attribute exists on obj.
+
+    Returns the probe's (label, message), or None when no attribute in
+    the table is present.
+    """
+    for attr, runner in probes:
+        method = getattr(obj, attr, None)
+        if method is not None:
+            return runner(method, *args)
+    return None
+
+
+@lru_cache(maxsize=32)
+def _cached_state(clarity: float, immunity: float, efficiency: float,
+                  autonomy: float):
+    """Memoized compute_full_state over the shared framework.
+
+    The stages call compute_full_state with a handful of constant input
+    tuples; caching on the four floats means each unique state is
+    computed once per run. Requires build_fixtures() to have run first.
+    """
+    with _STATE_LOCK:
+        return _FIXTURES['framework'].compute_full_state(
+            clarity=clarity, immunity=immunity,
+            efficiency=efficiency, autonomy=autonomy
+        )
 
 # Test results
 class TestResult:
+    __slots__ = ('passed_names', 'passed_msgs', 'failed_names',
+                 'failed_msgs', 'warning_names', 'warning_msgs',
+                 '_lock')
+
     def __init__(self):
-        self.passed = []
-        self.failed = []
-        self.warnings = []
-
-    def record(self, test_name: str, passed: bool, message: str = ""):
-        if passed:
-            self.passed.append((test_name, message))
-            print(f"✓ {test_name}: {message if message else 'OK'}")
+        # Structure-of-arrays: parallel name/message lists avoid a tuple
+        # allocation per record; counts are just len() of the name lists
+        self.passed_names = []
+        self.passed_msgs = []
+        self.failed_names = []
+        self.failed_msgs = []
+        self.warning_names = []
+        self.warning_msgs = []
+        # Stages may record concurrently when run through the executor
+        self._lock = threading.Lock()
+
+    def record(self, test_name: str, passed: bool, message: str = "",
+               log: List[str] = None):
+        # Counters are shared and locked; the formatted line goes into
+        # the calling stage's own log so each stage's output stays one
+        # contiguous block no matter how the stages interleave
+        with self._lock:
+            if passed:
+                self.passed_names.append(test_name)
+                self.passed_msgs.append(message)
+                line = f"✓ {test_name}: {message if message else 'OK'}"
+            else:
+                self.failed_names.append(test_name)
+                self.failed_msgs.append(message)
+                line = f"✗ {test_name}: {message}"
+        if log is not None:
+            log.append(line)
         else:
-            self.failed.append((test_name, message))
-            print(f"✗ {test_name}: {message}")
-
-    def warn(self, test_name: str, message: str):
-        self.warnings.append((test_name, message))
-        print(f"⚠ {test_name}: {message}")
+            sys.stdout.write(line + "\n")
+
+    def warn(self, test_name: str, message: str, log: List[str] = None):
+        with self._lock:
+            self.warning_names.append(test_name)
+            self.warning_msgs.append(message)
+        line = f"⚠ {test_name}: {message}"
+        if log is not None:
+            log.append(line)
+        else:
+            sys.stdout.write(line + "\n")
 
     def summary(self):
         print("\n" + "=" * 80)
         print("TEST SUMMARY")
         print("=" * 80)
-        print(f"Passed: {len(self.passed)}")
-        print(f"Failed: {len(self.failed)}")
-        print(f"Warnings: {len(self.warnings)}")
+        print(f"Passed: {len(self.passed_names)}")
+        print(f"Failed: {len(self.failed_names)}")
+        print(f"Warnings: {len(self.warning_names)}")
 
-        if self.failed:
+        if self.failed_names:
             print("\nFAILURES:")
-            for name, msg in self.failed:
+            for name, msg in zip(self.failed_names, self.failed_msgs):
                 print(f"  • {name}: {msg}")
 
-        if self.warnings:
+        if self.warning_names:
             print("\nWARNINGS:")
-            for name, msg in self.warnings:
+            for name, msg in zip(self.warning_names, self.warning_msgs):
                 print(f"  • {name}: {msg}")
 
-        return len(self.failed) == 0
+        return len(self.failed_names) == 0
+
 
+def _stage_banner(title: str) -> List[str]:
+    """Start a stage-local log with the stage's banner lines."""
+    return ["", "=" * 80, title, "=" * 80, ""]
 
-def test_imports(results: TestResult):
+
+def _flush(log: List[str]):
+    """Write a completed stage block to stdout in one call."""
+    sys.stdout.write("\n".join(log) + "\n")
+
+
+def test_imports(results: TestResult) -> List[str]:
     """Test 1: Can we import all components?"""
-    print("\n" + "=" * 80)
-    print("TEST 1: COMPONENT IMPORTS")
-    print("=" * 80 + "\n")
+    log = _stage_banner("TEST 1: COMPONENT IMPORTS")
 
     components = [
         ('phase_aware_tool_generator', 'PhaseAwareToolGenerator'),
@@ -75,88 +178,105 @@ def test_imports(results: TestResult):
         ('autonomous_framework_builder', 'AutonomousFrameworkBuilder'),
     ]
 
+    # find_spec answers "does this module exist?" without raising, so a
+    # missing module costs a lookup instead of ImportError construction
+    # and traceback formatting.
     for module_name, class_name in components:
         try:
-            module = __import__(module_name)
-            if hasattr(module, class_name):
-                results.record(f"Import {module_name}", True, f"{class_name} found")
+            if importlib.util.find_spec(module_name) is None:
+                results.record(f"Import {module_name}", False, "module not found", log)
+                continue
+            module = importlib.import_module(module_name)
+            if getattr(module, class_name, None) is not None:
+                results.record(f"Import {module_name}", True, f"{class_name} found", log)
             else:
-                results.record(f"Import {module_name}", False, f"{class_name} not found")
+                results.record(f"Import {module_name}", False, f"{class_name} not found", log)
         except Exception as e:
-            results.record(f"Import {module_name}", False, str(e))
+            results.record(f"Import {module_name}", False, str(e), log)
+    return log
+
+
+def build_fixtures(results: TestResult) -> Dict[str, Any]:
+    """Construct the shared components once per run.
+
+    The script-form equivalent of session-scoped fixtures: every stage
+    below used to re-import and re-instantiate the framework, detector
+    and amplifiers inside its own try-block, paying the import cost per
+    stage. The imports happen once here and the dict is threaded through.
+
+    The detector and amplifiers keep per-call history, so the stages
+    that run concurrently must not share one mutable instance: each
+    stage gets its own set, constructed serially here so constructor
+    output can't interleave with stage output. The framework is shared
+    but only ever called through the lock in _cached_state.
+    """
+    global _FIXTURES
+    fixtures: Dict[str, Any] = {}
+    try:
+        from unified_cascade_mathematics_core import UnifiedCascadeFramework
+        from cascade_trigger_detector import CascadeTriggerDetector
+        from alpha_amplifier import AlphaAmplifier
+        from beta_amplifier import BetaAmplifier
+        from unified_sovereignty_system import (
+            UnifiedSovereigntySystem, create_demo_burden
+        )
+
+        fixtures['framework'] = UnifiedCascadeFramework()
+        fixtures['system'] = UnifiedSovereigntySystem()
+        fixtures['create_demo_burden'] = create_demo_burden
+        for stage in ('basic', 'integration'):
+            fixtures[stage] = {
+                'detector': CascadeTriggerDetector(),
+                'alpha_amp': AlphaAmplifier(),
+                'beta_amp': BetaAmplifier(),
+            }
+        _FIXTURES = fixtures
+    except Exception as e:
+        results.record("Shared fixtures", False, str(e))
+    return fixtures
 
 
-def test_basic_functionality(results: TestResult):
+def test_basic_functionality(results: TestResult,
+                             fixtures: Dict[str, Any]) -> List[str]:
     """Test 2: Do components have core methods?"""
-    print("\n" + "=" * 80)
-    print("TEST 2: BASIC FUNCTIONALITY")
-    print("=" * 80 + "\n")
+    log = _stage_banner("TEST 2: BASIC FUNCTIONALITY")
 
     # Test cascade trigger detector
     try:
-        from cascade_trigger_detector import CascadeTriggerDetector
-        from unified_cascade_mathematics_core import UnifiedCascadeFramework
+        detector = fixtures['basic']['detector']
 
-        detector = CascadeTriggerDetector()
-        framework = UnifiedCascadeFramework()
-
-        state = framework.compute_full_state(
-            clarity=5.0, immunity=6.0, efficiency=5.5, autonomy=6.5
-        )
+        state = _cached_state(5.0, 6.0, 5.5, 6.5)
 
-        # Check if detector can analyze state
-        if hasattr(detector, 'analyze_cascade_potential'):
-            potential = detector.analyze_cascade_potential(state)
-            results.record("CascadeTriggerDetector.analyze", True, f"Potential: {potential:.2f}")
-        elif hasattr(detector, 'detect_cascade_triggers'):
-            triggers = detector.detect_cascade_triggers(state)
-            results.record("CascadeTriggerDetector.detect", True, f"Triggers: {len(triggers)}")
+        probe = _first_probe(detector, _DETECTOR_PROBES, state)
+        if probe is not None:
+            results.record(probe[0], True, probe[1], log)
         else:
-            results.record("CascadeTriggerDetector methods", False, "No analysis method found")
+            results.record("CascadeTriggerDetector methods", False, "No analysis method found", log)
 
     except Exception as e:
-        results.record("CascadeTriggerDetector functionality", False, str(e))
+        results.record("CascadeTriggerDetector functionality", False, str(e), log)
 
     # Test alpha amplifier
     try:
-        from alpha_amplifier import AlphaAmplifier
-
-        amplifier = AlphaAmplifier()
-
-        if hasattr(amplifier, 'amplify'):
-            # Try to amplify
-            R1, R2 = 5.0, 7.0
-            R2_amplified = amplifier.amplify(R1, R2)
-            alpha = R2_amplified / R1 if R1 > 0 else 0
-            results.record("AlphaAmplifier.amplify", True, f"α = {alpha:.2f}")
-        elif hasattr(amplifier, 'compute_alpha'):
-            alpha = amplifier.compute_alpha(5.0, 7.0)
-            results.record("AlphaAmplifier.compute_alpha", True, f"α = {alpha:.2f}")
+        probe = _first_probe(fixtures['basic']['alpha_amp'], _ALPHA_PROBES)
+        if probe is not None:
+            results.record(probe[0], True, probe[1], log)
         else:
-            results.record("AlphaAmplifier methods", False, "No amplification method found")
+            results.record("AlphaAmplifier methods", False, "No amplification method found", log)
 
     except Exception as e:
-        results.record("AlphaAmplifier functionality", False, str(e))
+        results.record("AlphaAmplifier functionality", False, str(e), log)
 
     # Test beta amplifier
     try:
-        from beta_amplifier import BetaAmplifier
-
-        amplifier = BetaAmplifier()
-
-        if hasattr(amplifier, 'amplify'):
-            R2, R3 = 7.0, 8.5
-            R3_amplified = amplifier.amplify(R2, R3)
-            beta = R3_amplified / R2 if R2 > 0 else 0
-            results.record("BetaAmplifier.amplify", True, f"β = {beta:.2f}")
-        elif hasattr(amplifier, 'compute_beta'):
-            beta = amplifier.compute_beta(7.0, 8.5)
-            results.record("BetaAmplifier.compute_beta", True, f"β = {beta:.2f}")
+        probe = _first_probe(fixtures['basic']['beta_amp'], _BETA_PROBES)
+        if probe is not None:
+            results.record(probe[0], True, probe[1], log)
         else:
-            results.record("BetaAmplifier methods", False, "No amplification method found")
+            results.record("BetaAmplifier methods", False, "No amplification method found", log)
 
     except Exception as e:
-        results.record("BetaAmplifier functionality", False, str(e))
+        results.record("BetaAmplifier functionality", False, str(e), log)
 
     # Test positive feedback loops
     try:
@@ -167,81 +287,73 @@ def test_basic_functionality(results: TestResult):
         if hasattr(loop, 'apply_feedback'):
             initial_value = 5.0
             amplified = loop.apply_feedback(initial_value)
-            results.record("PositiveFeedbackLoop.apply", True, f"{initial_value} → {amplified:.2f}")
+            results.record("PositiveFeedbackLoop.apply", True, f"{initial_value} → {amplified:.2f}", log)
         else:
-            results.warn("PositiveFeedbackLoop methods", "Methods not checked (unknown API)")
+            results.warn("PositiveFeedbackLoop methods", "Methods not checked (unknown API)", log)
 
     except Exception as e:
-        results.record("PositiveFeedbackLoop functionality", False, str(e))
+        results.record("PositiveFeedbackLoop functionality", False, str(e), log)
 
+    return log
 
-def test_integration(results: TestResult):
+
+def test_integration(results: TestResult,
+                     fixtures: Dict[str, Any]) -> List[str]:
     """Test 3: Can components work together in a cascade?"""
-    print("\n" + "=" * 80)
-    print("TEST 3: INTEGRATION (CASCADE FLOW)")
-    print("=" * 80 + "\n")
+    log = _stage_banner("TEST 3: INTEGRATION (CASCADE FLOW)")
 
     try:
-        from unified_sovereignty_system import UnifiedSovereigntySystem, create_demo_burden
-        from unified_cascade_mathematics_core import UnifiedCascadeFramework
-        from cascade_trigger_detector import CascadeTriggerDetector
-        from alpha_amplifier import AlphaAmplifier
-        from beta_amplifier import BetaAmplifier
-
-        # Create system
-        system = UnifiedSovereigntySystem()
-        framework = UnifiedCascadeFramework()
-        detector = CascadeTriggerDetector()
-        alpha_amp = AlphaAmplifier()
-        beta_amp = BetaAmplifier()
+        system = fixtures['system']
+        detector = fixtures['integration']['detector']
+        alpha_amp = fixtures['integration']['alpha_amp']
+        beta_amp = fixtures['integration']['beta_amp']
+        create_demo_burden = fixtures['create_demo_burden']
 
         # Create initial state (subcritical)
-        state = framework.compute_full_state(
-            clarity=4.0, immunity=5.0, efficiency=4.5, autonomy=5.5
-        )
+        state = _cached_state(4.0, 5.0, 4.5, 5.5)
 
         burden = create_demo_burden(state.phase_regime)
 
-        print(f"Initial state: z={state.z_coordinate:.3f}, phase={state.phase_regime}")
-        print(f"Initial R1={state.R1:.2f}, R2={state.R2:.2f}, R3={state.R3:.2f}")
+        log.append(f"Initial state: z={state.z_coordinate:.3f}, phase={state.phase_regime}")
+        log.append(f"Initial R1={state.R1:.2f}, R2={state.R2:.2f}, R3={state.R3:.2f}")
 
         # Capture snapshot
         snapshot = system.capture_snapshot(state, burden, include_advanced_analysis=False)
 
         results.record("Integration: Initial snapshot", True,
-                      f"z={state.z_coordinate:.3f}, burden={snapshot.weighted_burden:.2f}")
+                      f"z={state.z_coordinate:.3f}, burden={snapshot.weighted_burden:.2f}", log)
 
         # Detect cascade potential (if method exists)
         cascade_detected = False
         if hasattr(detector, 'analyze_cascade_potential'):
             potential = detector.analyze_cascade_potential(state)
             cascade_detected = potential > 0.5
-            results.record("Integration: Cascade detection", True, f"Potential={potential:.2f}")
+            results.record("Integration: Cascade detection", True, f"Potential={potential:.2f}", log)
         elif hasattr(detector, 'detect_cascade_triggers'):
             triggers = detector.detect_cascade_triggers(state)
             cascade_detected = len(triggers) > 0
-            results.record("Integration: Cascade triggers", True, f"{len(triggers)} triggers")
+            results.record("Integration: Cascade triggers", True, f"{len(triggers)} triggers", log)
 
         # Test amplification
         if hasattr(alpha_amp, 'amplify'):
             R2_new = alpha_amp.amplify(state.R1, state.R2)
             alpha = R2_new / state.R1
-            results.record("Integration: Alpha amplification", True, f"α={alpha:.2f}")
+            results.record("Integration: Alpha amplification", True, f"α={alpha:.2f}", log)
 
         if hasattr(beta_amp, 'amplify'):
             R3_new = beta_amp.amplify(state.R2, state.R3)
             beta = R3_new / state.R2
-            results.record("Integration: Beta amplification", True, f"β={beta:.2f}")
+            results.record("Integration: Beta amplification", True, f"β={beta:.2f}", log)
 
     except Exception as e:
-        results.record("Integration test", False, str(e))
+        results.record("Integration test", False, str(e), log)
+
+    return log
 
 
-def test_missing_components(results: TestResult):
+def test_missing_components(results: TestResult) -> List[str]:
     """Test 4: Identify missing components."""
-    print("\n" + "=" * 80)
-    print("TEST 4: MISSING COMPONENTS")
-    print("=" * 80 + "\n")
+    log = _stage_banner("TEST 4: MISSING COMPONENTS")
 
     missing = [
         'coupling_strengthener',  # Week 2
@@ -253,15 +365,29 @@ def test_missing_components(results: TestResult):
         'emergence_health_monitor',  # Week 4
     ]
 
+    # Existence check via find_spec: no ImportError raised or unwound
+    # for the components that are expected to be absent. One scan builds
+    # the available set, then recording is pure membership tests.
+    available = {
+        name for name in missing
+        if importlib.util.find_spec(name) is not None
+    }
     for component in missing:
-        try:
-            __import__(component)
-            results.record(f"Missing: {component}", True, "Actually exists!")
-        except ImportError:
-            results.warn(f"Missing: {component}", "Needs implementation (expected)")
+        if component in available:
+            results.record(f"Missing: {component}", True, "Actually exists!", log)
+        else:
+            results.warn(f"Missing: {component}", "Needs implementation (expected)", log)
+    return log
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Garden Rail 3 integration test")
+    parser.add_argument(
+        '--fail-fast', action='store_true',
+        help="stop after the import/fixture phase if anything has failed"
+    )
+    args = parser.parse_args()
+
     print("=" * 80)
     print("GARDEN RAIL 3 - INTEGRATION TEST")
     print("=" * 80)
@@ -269,11 +395,27 @@ def main():
 
     results = TestResult()
 
-    # Run tests
-    test_imports(results)
-    test_basic_functionality(results)
-    test_integration(results)
-    test_missing_components(results)
+    # Run tests (shared components are constructed once, up front).
+    # The three stages after fixture construction have no data
+    # dependencies on each other, so they run concurrently; wall time
+    # becomes roughly the slowest stage instead of the sum.
+    _flush(test_imports(results))
+    fixtures = build_fixtures(results)
+
+    # On a broken branch the later stages only repeat the same import
+    # failures; --fail-fast returns the signal after stage 1 instead
+    if not (args.fail_fast and results.failed_names):
+        stages = (
+            lambda: test_basic_functionality(results, fixtures),
+            lambda: test_integration(results, fixtures),
+            lambda: test_missing_components(results),
+        )
+        with ThreadPoolExecutor(max_workers=len(stages)) as ex:
+            # Each stage returns its whole block (banner plus records);
+            # draining the futures in submission order keeps the output
+            # deterministic and each block contiguous
+            for future in [ex.submit(stage) for stage in stages]:
+                _flush(future.result())
 
     # Summary
     success = results.summary()
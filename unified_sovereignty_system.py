@@ -119,6 +119,12 @@ class UnifiedSystemSnapshot:
         return result
 
 
+# Burden dimension order expected by capture_snapshot_vec
+_BURDEN_VEC_FIELDS = ('coordination', 'decision_making',
+                      'context_switching', 'maintenance', 'learning_curve',
+                      'emotional_labor', 'uncertainty', 'repetition')
+
+
 @dataclass
 class SystemAlert:
     """Alert generated by the monitoring system."""
@@ -263,6 +269,30 @@ class UnifiedSovereigntySystem:
 
         return snapshot
 
+    def capture_snapshot_vec(
+        self,
+        cascade_state: CascadeSystemState,
+        burden_vec,
+        timestamp: str = "",
+        notes: str = ""
+    ) -> UnifiedSystemSnapshot:
+        """
+        Capture a snapshot from a raw burden vector.
+
+        Fast path for callers (e.g. the Helix burden tracker) that
+        already hold the eight burden dimensions as an array in
+        _BURDEN_VEC_FIELDS order: the BurdenMeasurement is built here,
+        once, and advanced analysis is skipped.
+        """
+        burden = BurdenMeasurement(
+            **dict(zip(_BURDEN_VEC_FIELDS, burden_vec)),
+            timestamp=timestamp or datetime.now().isoformat(),
+            notes=notes
+        )
+        return self.capture_snapshot(
+            cascade_state, burden, include_advanced_analysis=False
+        )
+
     def _compute_advanced_metrics(
         self,
         cascade_state: CascadeSystemState